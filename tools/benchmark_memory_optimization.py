@@ -9,112 +9,250 @@ providing detailed statistics and performance analysis.
 import os
 import sys
 import json
+import math
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
 import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
 
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent))
-from optimize_puzzle_assets import PuzzleOptimizer
+
+DEFAULT_GRID_SIZES = ['8x8', '12x12', '15x15']
+
+BYTES_PER_MB = 1024 * 1024
+
+# Original pieces are estimated as 2048x2048 RGBA (4 bytes per pixel), i.e. 16 MB
+BYTES_PER_PIECE = 2048 * 2048 * 4
+
+# Mobile device impact messages as (threshold_mb, message), checked in order
+MOBILE_IMPACT_BEFORE = (
+    (2000, "❌ Would crash on most mobile devices (>2GB)"),
+    (1000, "⚠️  High memory usage, crashes likely (>1GB)"),
+    (-math.inf, "✅ Acceptable for high-end devices"),
+)
+MOBILE_IMPACT_AFTER = (
+    (1000, "⚠️  Still high, but much improved"),
+    (500, "✅ Good - works on most devices"),
+    (-math.inf, "🚀 Excellent - works on all devices"),
+)
+
+def mobile_impact(buckets: Tuple[Tuple[float, str], ...], memory_mb: float) -> str:
+    """Pick the first impact message whose threshold the memory usage exceeds."""
+    return next(message for threshold, message in buckets if memory_mb > threshold)
+
+def ratio(numerator: int, denominator: int) -> float:
+    """Divide two byte counts, treating an empty denominator as no change."""
+    return numerator / denominator if denominator else 0.0
+
+class StatsUnavailable(NamedTuple):
+    """Reason a grid's memory statistics could not be calculated."""
+    error: str
+
+class OriginalStats(NamedTuple):
+    """Estimated memory usage of the original padded pieces."""
+    pieces_count: int
+    bytes_per_piece: int
+    total_bytes: int
+    grid_dimensions: str
+
+class OptimizedStats(NamedTuple):
+    """Measured memory usage of the optimized pieces."""
+    pieces_count: int
+    actual_total_bytes: int
+    theoretical_reduction_percent: float
+    theoretical_original_bytes: int
+    theoretical_optimized_bytes: int
+    avg_piece_size_bytes: int
+    min_piece_size: int
+    max_piece_size: int
+    grid_dimensions: str
+
+class GridResult(NamedTuple):
+    """Original vs optimized comparison for a single grid size."""
+    original: Union[OriginalStats, StatsUnavailable]
+    optimized: Union[OptimizedStats, StatsUnavailable]
+    analysis: Dict
+
+def to_json_data(value):
+    """Recursively convert result records into plain dicts for JSON output."""
+    if hasattr(value, '_asdict'):
+        value = value._asdict()
+    if isinstance(value, dict):
+        return {key: to_json_data(item) for key, item in value.items()}
+    return value
+
+def summarize_piece_sizes(sizes: Iterable[int]) -> Tuple[int, int, int, int]:
+    """Return (total, count, min, max) of piece sizes in a single pass."""
+    total = 0
+    count = 0
+    min_size = math.inf
+    max_size = 0
+    for size in sizes:
+        total += size
+        count += 1
+        if size < min_size:
+            min_size = size
+        if size > max_size:
+            max_size = size
+    return total, count, (min_size if count else 0), max_size
+
+@lru_cache(maxsize=256)
+def _original_memory_usage(pieces_path: str, mtime_ns: int, grid_size: str) -> OriginalStats:
+    """Estimate original memory usage, cached per pieces directory and mtime."""
+    with os.scandir(pieces_path) as entries:
+        pieces_count = sum(1 for entry in entries
+                           if entry.name.endswith('.png') and entry.is_file(follow_symlinks=False))
+    
+    return OriginalStats(
+        pieces_count=pieces_count,
+        bytes_per_piece=BYTES_PER_PIECE,
+        total_bytes=pieces_count * BYTES_PER_PIECE,
+        grid_dimensions=grid_size,
+    )
 
 class MemoryBenchmark:
     """Benchmark tool for memory optimization analysis."""
     
-    def __init__(self, base_path: str, verbose: bool = False):
-        self.base_path = Path(base_path)
+    def __init__(self, base_path: str, verbose: bool = False, verify: bool = False):
+        # Resolve once so every derived path skips symlink re-walks
+        self.base_path = Path(base_path).resolve()
         self.verbose = verbose
-        self.optimizer = PuzzleOptimizer(base_path, verbose)
+        self.verify = verify
+    
+    @cached_property
+    def optimizer(self):
+        """Puzzle optimizer, imported and constructed on first use only."""
+        from optimize_puzzle_assets import PuzzleOptimizer
+        return PuzzleOptimizer(str(self.base_path), self.verbose)
     
     def log(self, message: str) -> None:
         """Print log message if verbose is enabled."""
         if self.verbose:
             print(f"[MemoryBenchmark] {message}")
     
-    def calculate_original_memory_usage(self, puzzle_id: str, grid_size: str) -> Dict:
+    def calculate_original_memory_usage(self, puzzle_id: str,
+                                        grid_size: str) -> Union[OriginalStats, StatsUnavailable]:
         """Calculate memory usage for original (non-optimized) assets."""
-        pieces_path = self.base_path / "assets" / "puzzles" / puzzle_id / "layouts" / grid_size / "pieces"
-        
-        if not pieces_path.exists():
-            return {"error": f"Pieces directory not found: {pieces_path}"}
+        pieces_path = Path(f"{self.base_path}/assets/puzzles/{puzzle_id}/layouts/{grid_size}/pieces")
         
-        piece_files = list(pieces_path.glob("*.png"))
-        pieces_count = len(piece_files)
-        
-        # Estimate memory assuming 2048x2048 RGBA
-        bytes_per_piece = 2048 * 2048 * 4  # RGBA = 4 bytes per pixel
-        total_bytes = pieces_count * bytes_per_piece
-        total_mb = total_bytes / (1024 * 1024)
-        total_gb = total_mb / 1024
+        try:
+            # Directory mtime changes whenever pieces are added or removed
+            mtime_ns = os.stat(pieces_path).st_mtime_ns
+        except FileNotFoundError:
+            return StatsUnavailable(f"Pieces directory not found: {pieces_path}")
         
-        return {
-            "pieces_count": pieces_count,
-            "bytes_per_piece": bytes_per_piece,
-            "total_bytes": total_bytes,
-            "total_mb": round(total_mb, 1),
-            "total_gb": round(total_gb, 2),
-            "grid_dimensions": grid_size,
-        }
+        return _original_memory_usage(str(pieces_path), mtime_ns, grid_size)
     
-    def calculate_optimized_memory_usage(self, puzzle_id: str, grid_size: str) -> Dict:
+    def calculate_optimized_memory_usage(self, puzzle_id: str,
+                                         grid_size: str) -> Union[OptimizedStats, StatsUnavailable]:
         """Calculate memory usage for optimized assets."""
-        optimized_path = self.base_path / "assets" / "puzzles" / puzzle_id / "layouts" / f"{grid_size}_optimized"
+        optimized_path = Path(f"{self.base_path}/assets/puzzles/{puzzle_id}/layouts/{grid_size}_optimized")
         metadata_path = optimized_path / "optimization_metadata.json"
         
-        if not metadata_path.exists():
-            return {"error": f"Optimization metadata not found: {metadata_path}"}
+        try:
+            raw_metadata = metadata_path.read_bytes()
+        except FileNotFoundError:
+            return StatsUnavailable(f"Optimization metadata not found: {metadata_path}")
         
         try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(raw_metadata) if orjson else json.loads(raw_metadata)
             
             stats = metadata.get('statistics', {})
             pieces = metadata.get('pieces', {})
             
-            # Calculate actual file sizes
-            pieces_path = optimized_path / "pieces"
-            actual_total_bytes = 0
-            piece_sizes = []
-            
-            for piece_file in pieces_path.glob("*.png"):
-                size = piece_file.stat().st_size
-                actual_total_bytes += size
-                piece_sizes.append(size)
-            
-            actual_total_mb = actual_total_bytes / (1024 * 1024)
-            actual_total_gb = actual_total_mb / 1024
+            # Calculate actual file sizes. When the metadata already records
+            # each piece's on-disk size, trust it instead of statting every file.
+            if not self.verify and pieces and all('size' in piece for piece in pieces.values()):
+                piece_sizes = (piece['size'] for piece in pieces.values())
+                actual_total_bytes, piece_count, min_piece_size, max_piece_size = \
+                    summarize_piece_sizes(piece_sizes)
+            else:
+                # Single directory walk. Pieces are regular files, so skipping
+                # symlink resolution lets DirEntry reuse the scandir type data.
+                with os.scandir(optimized_path / "pieces") as entries:
+                    piece_sizes = (entry.stat(follow_symlinks=False).st_size for entry in entries
+                                   if entry.name.endswith('.png') and entry.is_file(follow_symlinks=False))
+                    actual_total_bytes, piece_count, min_piece_size, max_piece_size = \
+                        summarize_piece_sizes(piece_sizes)
             
             # Get theoretical calculations from metadata
             theoretical_reduction = stats.get('memory_reduction_percent', 0)
             original_bytes = stats.get('original_total_bytes', 0)
             optimized_bytes = stats.get('optimized_total_bytes', 0)
             
-            avg_piece_size_bytes = actual_total_bytes / len(pieces) if pieces else 0
-            avg_piece_size_kb = avg_piece_size_bytes / 1024
+            avg_piece_size_bytes = actual_total_bytes // piece_count if piece_count else 0
             
-            return {
-                "pieces_count": len(pieces),
-                "actual_total_bytes": actual_total_bytes,
-                "actual_total_mb": round(actual_total_mb, 1),
-                "actual_total_gb": round(actual_total_gb, 2),
-                "theoretical_reduction_percent": round(theoretical_reduction, 1),
-                "theoretical_original_bytes": original_bytes,
-                "theoretical_optimized_bytes": optimized_bytes,
-                "avg_piece_size_bytes": round(avg_piece_size_bytes),
-                "avg_piece_size_kb": round(avg_piece_size_kb, 1),
-                "min_piece_size": min(piece_sizes) if piece_sizes else 0,
-                "max_piece_size": max(piece_sizes) if piece_sizes else 0,
-                "grid_dimensions": grid_size,
-            }
+            return OptimizedStats(
+                pieces_count=piece_count,
+                actual_total_bytes=actual_total_bytes,
+                theoretical_reduction_percent=theoretical_reduction,
+                theoretical_original_bytes=original_bytes,
+                theoretical_optimized_bytes=optimized_bytes,
+                avg_piece_size_bytes=avg_piece_size_bytes,
+                min_piece_size=min_piece_size,
+                max_piece_size=max_piece_size,
+                grid_dimensions=grid_size,
+            )
             
         except Exception as e:
-            return {"error": f"Failed to read optimization metadata: {e}"}
+            return StatsUnavailable(f"Failed to read optimization metadata: {e}")
     
     def run_benchmark(self, puzzle_id: str, grid_sizes: List[str] = None) -> Dict:
         """Run complete benchmark analysis for a puzzle."""
         if grid_sizes is None:
-            grid_sizes = ['8x8', '12x12', '15x15']
+            grid_sizes = DEFAULT_GRID_SIZES
+        
+        # The per-grid calculations are independent and dominated by
+        # filesystem latency, so run them concurrently on a thread pool
+        with ThreadPoolExecutor(max_workers=min(8, 2 * len(grid_sizes)) or 1) as executor:
+            pending = []
+            for grid_size in grid_sizes:
+                self.log(f"Analyzing {puzzle_id} {grid_size}")
+                pending.append((
+                    grid_size,
+                    executor.submit(self.calculate_original_memory_usage, puzzle_id, grid_size),
+                    executor.submit(self.calculate_optimized_memory_usage, puzzle_id, grid_size),
+                ))
+        
+        measurements = [(grid_size, original_future.result(), optimized_future.result())
+                        for grid_size, original_future, optimized_future in pending]
+        return self._build_results(puzzle_id, grid_sizes, measurements)
+    
+    async def run_benchmark_async(self, puzzle_id: str, grid_sizes: List[str] = None) -> Dict:
+        """Run complete benchmark analysis for a puzzle without blocking the event loop."""
+        if grid_sizes is None:
+            grid_sizes = DEFAULT_GRID_SIZES
         
+        calls = []
+        for grid_size in grid_sizes:
+            self.log(f"Analyzing {puzzle_id} {grid_size}")
+            calls.append(asyncio.to_thread(self.calculate_original_memory_usage, puzzle_id, grid_size))
+            calls.append(asyncio.to_thread(self.calculate_optimized_memory_usage, puzzle_id, grid_size))
+        
+        stats = await asyncio.gather(*calls)
+        measurements = [(grid_size, stats[2 * i], stats[2 * i + 1])
+                        for i, grid_size in enumerate(grid_sizes)]
+        return self._build_results(puzzle_id, grid_sizes, measurements)
+    
+    async def run_benchmarks_async(self, puzzle_ids: List[str],
+                                   grid_sizes: List[str] = None) -> List[Dict]:
+        """Benchmark several puzzles concurrently, overlapping all filesystem work."""
+        return await asyncio.gather(*(self.run_benchmark_async(puzzle_id, grid_sizes)
+                                      for puzzle_id in puzzle_ids))
+    
+    def _build_results(self, puzzle_id: str, grid_sizes: List[str],
+                       measurements: List[Tuple[str, Union[OriginalStats, StatsUnavailable],
+                                                Union[OptimizedStats, StatsUnavailable]]]) -> Dict:
+        """Compare original and optimized stats per grid and summarize them."""
         results = {
             "puzzle_id": puzzle_id,
             "timestamp": time.time(),
@@ -122,69 +260,50 @@ class MemoryBenchmark:
             "summary": {}
         }
         
-        total_original_mb = 0
-        total_optimized_mb = 0
+        # Totals stay in integer bytes; conversion to MB happens only when printing
+        total_original_bytes = 0
+        total_optimized_bytes = 0
         optimized_grids = 0
         
-        for grid_size in grid_sizes:
-            self.log(f"Analyzing {puzzle_id} {grid_size}")
-            
-            # Calculate original memory usage
-            original = self.calculate_original_memory_usage(puzzle_id, grid_size)
-            
-            # Calculate optimized memory usage
-            optimized = self.calculate_optimized_memory_usage(puzzle_id, grid_size)
-            
-            grid_result = {
-                "original": original,
-                "optimized": optimized,
-                "analysis": {}
-            }
-            
+        for grid_size, original, optimized in measurements:
             # Perform comparison analysis
-            if "error" not in original and "error" not in optimized:
-                reduction_mb = original["total_mb"] - optimized["actual_total_mb"]
-                reduction_percent = (reduction_mb / original["total_mb"]) * 100
-                compression_ratio = original["total_mb"] / optimized["actual_total_mb"]
+            if isinstance(original, OriginalStats) and isinstance(optimized, OptimizedStats):
+                saved_bytes = original.total_bytes - optimized.actual_total_bytes
                 
-                grid_result["analysis"] = {
-                    "memory_saved_mb": round(reduction_mb, 1),
-                    "memory_saved_gb": round(reduction_mb / 1024, 2),
-                    "reduction_percent": round(reduction_percent, 1),
-                    "compression_ratio": round(compression_ratio, 1),
+                analysis = {
+                    "memory_saved_bytes": saved_bytes,
+                    "reduction_percent": ratio(saved_bytes * 100, original.total_bytes),
+                    "compression_ratio": ratio(original.total_bytes, optimized.actual_total_bytes),
                     "status": "optimized"
                 }
                 
-                total_original_mb += original["total_mb"]
-                total_optimized_mb += optimized["actual_total_mb"]
+                total_original_bytes += original.total_bytes
+                total_optimized_bytes += optimized.actual_total_bytes
                 optimized_grids += 1
                 
-            elif "error" not in original:
-                grid_result["analysis"] = {
+            elif isinstance(original, OriginalStats):
+                analysis = {
                     "status": "not_optimized",
-                    "potential_savings_mb": original["total_mb"] * 0.7,  # Estimate 70% savings
-                    "potential_savings_gb": (original["total_mb"] * 0.7) / 1024,
+                    "potential_savings_bytes": original.total_bytes * 7 // 10,  # Estimate 70% savings
                 }
-                total_original_mb += original["total_mb"]
+                total_original_bytes += original.total_bytes
             else:
-                grid_result["analysis"] = {"status": "unavailable"}
+                analysis = {"status": "unavailable"}
             
-            results["grid_sizes"][grid_size] = grid_result
+            results["grid_sizes"][grid_size] = GridResult(original, optimized, analysis)
         
         # Calculate summary statistics
         if optimized_grids > 0:
-            overall_reduction = ((total_original_mb - total_optimized_mb) / total_original_mb) * 100
-            overall_compression = total_original_mb / total_optimized_mb
+            total_saved_bytes = total_original_bytes - total_optimized_bytes
             
             results["summary"] = {
                 "total_grids_analyzed": len(grid_sizes),
                 "optimized_grids": optimized_grids,
-                "total_original_memory_mb": round(total_original_mb, 1),
-                "total_optimized_memory_mb": round(total_optimized_mb, 1),
-                "total_memory_saved_mb": round(total_original_mb - total_optimized_mb, 1),
-                "total_memory_saved_gb": round((total_original_mb - total_optimized_mb) / 1024, 2),
-                "overall_reduction_percent": round(overall_reduction, 1),
-                "overall_compression_ratio": round(overall_compression, 1),
+                "total_original_memory_bytes": total_original_bytes,
+                "total_optimized_memory_bytes": total_optimized_bytes,
+                "total_memory_saved_bytes": total_saved_bytes,
+                "overall_reduction_percent": ratio(total_saved_bytes * 100, total_original_bytes),
+                "overall_compression_ratio": ratio(total_original_bytes, total_optimized_bytes),
                 "optimization_status": "partial" if optimized_grids < len(grid_sizes) else "complete"
             }
         
@@ -192,73 +311,69 @@ class MemoryBenchmark:
     
     def print_benchmark_results(self, results: Dict) -> None:
         """Print formatted benchmark results."""
+        # Collect lines and emit them with a single write
+        out = []
         puzzle_id = results["puzzle_id"]
-        print(f"\n{'='*60}")
-        print(f"Memory Optimization Benchmark: {puzzle_id}")
-        print(f"{'='*60}")
+        out.append(f"\n{'='*60}")
+        out.append(f"Memory Optimization Benchmark: {puzzle_id}")
+        out.append(f"{'='*60}")
         
-        for grid_size, data in results["grid_sizes"].items():
-            print(f"\n📐 {grid_size} Grid:")
-            print("-" * 20)
+        for grid_size, (original, optimized, analysis) in results["grid_sizes"].items():
+            out.append(f"\n📐 {grid_size} Grid:")
+            out.append("-" * 20)
             
-            original = data["original"]
-            optimized = data["optimized"]
-            analysis = data["analysis"]
-            
-            if "error" in original:
-                print(f"   ❌ Original: {original['error']}")
+            if isinstance(original, StatsUnavailable):
+                out.append(f"   ❌ Original: {original.error}")
                 continue
             
-            print(f"   📊 Original:  {original['total_mb']} MB ({original['pieces_count']} pieces)")
+            out.append(f"   📊 Original:  {original.total_bytes / BYTES_PER_MB:.1f} MB ({original.pieces_count} pieces)")
             
-            if "error" in optimized:
-                print(f"   ⚠️  Optimized: Not available ({optimized['error']})")
-                if "potential_savings_mb" in analysis:
-                    print(f"   💡 Potential:  ~{analysis['potential_savings_mb']:.1f} MB savings (est. 70%)")
+            if isinstance(optimized, StatsUnavailable):
+                out.append(f"   ⚠️  Optimized: Not available ({optimized.error})")
+                if "potential_savings_bytes" in analysis:
+                    out.append(f"   💡 Potential:  ~{analysis['potential_savings_bytes'] / BYTES_PER_MB:.1f} MB savings (est. 70%)")
             else:
-                print(f"   ✅ Optimized: {optimized['actual_total_mb']} MB ({optimized['pieces_count']} pieces)")
-                if "memory_saved_mb" in analysis:
-                    print(f"   💾 Savings:   {analysis['memory_saved_mb']} MB ({analysis['reduction_percent']:.1f}%)")
-                    print(f"   📈 Ratio:     {analysis['compression_ratio']:.1f}:1 compression")
+                out.append(f"   ✅ Optimized: {optimized.actual_total_bytes / BYTES_PER_MB:.1f} MB ({optimized.pieces_count} pieces)")
+                if "memory_saved_bytes" in analysis:
+                    out.append(f"   💾 Savings:   {analysis['memory_saved_bytes'] / BYTES_PER_MB:.1f} MB ({analysis['reduction_percent']:.1f}%)")
+                    out.append(f"   📈 Ratio:     {analysis['compression_ratio']:.1f}:1 compression")
         
         # Print summary
         if "summary" in results and results["summary"]:
             summary = results["summary"]
-            print(f"\n🎯 Overall Summary:")
-            print("-" * 20)
-            print(f"   Grids analyzed: {summary['total_grids_analyzed']}")
-            print(f"   Optimized grids: {summary['optimized_grids']}")
+            out.append(f"\n🎯 Overall Summary:")
+            out.append("-" * 20)
+            out.append(f"   Grids analyzed: {summary['total_grids_analyzed']}")
+            out.append(f"   Optimized grids: {summary['optimized_grids']}")
             
             if summary["optimized_grids"] > 0:
-                print(f"   Total original: {summary['total_original_memory_mb']} MB")
-                print(f"   Total optimized: {summary['total_optimized_memory_mb']} MB")
-                print(f"   Total saved: {summary['total_memory_saved_mb']} MB ({summary['overall_reduction_percent']:.1f}%)")
-                print(f"   Overall ratio: {summary['overall_compression_ratio']:.1f}:1")
+                original_mb = summary['total_original_memory_bytes'] / BYTES_PER_MB
+                optimized_mb = summary['total_optimized_memory_bytes'] / BYTES_PER_MB
+                saved_mb = summary['total_memory_saved_bytes'] / BYTES_PER_MB
+                out.append(f"   Total original: {original_mb:.1f} MB")
+                out.append(f"   Total optimized: {optimized_mb:.1f} MB")
+                out.append(f"   Total saved: {saved_mb:.1f} MB ({summary['overall_reduction_percent']:.1f}%)")
+                out.append(f"   Overall ratio: {summary['overall_compression_ratio']:.1f}:1")
                 
                 # Mobile device impact
-                print(f"\n📱 Mobile Device Impact:")
-                print("-" * 25)
-                if summary['total_original_memory_mb'] > 2000:
-                    print("   Before: ❌ Would crash on most mobile devices (>2GB)")
-                elif summary['total_original_memory_mb'] > 1000:
-                    print("   Before: ⚠️  High memory usage, crashes likely (>1GB)")
-                else:
-                    print("   Before: ✅ Acceptable for high-end devices")
-                
-                if summary['total_optimized_memory_mb'] > 1000:
-                    print("   After:  ⚠️  Still high, but much improved")
-                elif summary['total_optimized_memory_mb'] > 500:
-                    print("   After:  ✅ Good - works on most devices")
-                else:
-                    print("   After:  🚀 Excellent - works on all devices")
+                out.append(f"\n📱 Mobile Device Impact:")
+                out.append("-" * 25)
+                out.append(f"   Before: {mobile_impact(MOBILE_IMPACT_BEFORE, original_mb)}")
+                out.append(f"   After:  {mobile_impact(MOBILE_IMPACT_AFTER, optimized_mb)}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def save_benchmark_results(self, results: Dict, output_path: str) -> None:
         """Save benchmark results to JSON file."""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Serialize in one shot and hand the buffer to a single write
+        data = to_json_data(results)
+        if orjson:
+            output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(json.dumps(data, indent=2))
         
         self.log(f"Benchmark results saved to: {output_file}")
 
@@ -272,6 +387,9 @@ Examples:
   # Run complete benchmark
   python benchmark_memory_optimization.py sample_puzzle_01
   
+  # Benchmark several puzzles concurrently
+  python benchmark_memory_optimization.py sample_puzzle_01 sample_puzzle_02
+  
   # Benchmark specific grid sizes
   python benchmark_memory_optimization.py sample_puzzle_01 --grid-sizes 8x8 12x12
   
@@ -280,38 +398,54 @@ Examples:
   
   # Verbose output
   python benchmark_memory_optimization.py sample_puzzle_01 --verbose
+  
+  # Stat every optimized piece instead of trusting metadata sizes
+  python benchmark_memory_optimization.py sample_puzzle_01 --verify
         """
     )
     
-    parser.add_argument('puzzle_id', help='Puzzle identifier (e.g., sample_puzzle_01)')
+    parser.add_argument('puzzle_ids', nargs='+', metavar='puzzle_id',
+                        help='Puzzle identifier(s) (e.g., sample_puzzle_01)')
     parser.add_argument('--grid-sizes', nargs='+', help='Specific grid sizes to benchmark')
     parser.add_argument('--output', '-o', help='Save results to JSON file')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--base-path', default='.', help='Base path to puzzle game project')
+    parser.add_argument('--verify', action='store_true',
+                        help='Always stat optimized piece files instead of trusting sizes recorded in metadata')
     
     args = parser.parse_args()
     
     # Initialize benchmark tool
-    benchmark = MemoryBenchmark(args.base_path, verbose=args.verbose)
+    benchmark = MemoryBenchmark(args.base_path, verbose=args.verbose, verify=args.verify)
     
-    # Run benchmark
-    results = benchmark.run_benchmark(args.puzzle_id, args.grid_sizes)
+    # Run benchmark; multiple puzzles are scanned concurrently
+    if len(args.puzzle_ids) == 1:
+        all_results = [benchmark.run_benchmark(args.puzzle_ids[0], args.grid_sizes)]
+    else:
+        all_results = asyncio.run(benchmark.run_benchmarks_async(args.puzzle_ids, args.grid_sizes))
     
     # Print results
-    benchmark.print_benchmark_results(results)
+    for results in all_results:
+        benchmark.print_benchmark_results(results)
     
     # Save results if requested
     if args.output:
-        benchmark.save_benchmark_results(results, args.output)
+        if len(all_results) == 1:
+            benchmark.save_benchmark_results(all_results[0], args.output)
+        else:
+            benchmark.save_benchmark_results(
+                {results["puzzle_id"]: results for results in all_results}, args.output)
     
     # Return appropriate exit code
-    summary = results.get("summary", {})
-    if summary and summary.get("optimized_grids", 0) > 0:
+    unoptimized = [results["puzzle_id"] for results in all_results
+                   if not results.get("summary", {}).get("optimized_grids", 0)]
+    if not unoptimized:
         print(f"\n✅ Benchmark completed successfully!")
         sys.exit(0)
     else:
         print(f"\n⚠️  No optimized assets found. Run optimization first:")
-        print(f"python tools/optimize_puzzle_assets.py {args.puzzle_id}")
+        for puzzle_id in unoptimized:
+            print(f"python tools/optimize_puzzle_assets.py {puzzle_id}")
         sys.exit(1)
 
 if __name__ == '__main__':
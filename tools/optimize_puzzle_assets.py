@@ -18,12 +18,24 @@ import sys
 import json
 import argparse
 import hashlib
+import io
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional, NamedTuple
 from pathlib import Path
 import numpy as np
 from PIL import Image
 
+try:
+    import orjson  # Optional: faster metadata serialization
+except ImportError:
+    orjson = None
+
+try:
+    import oxipng  # Optional: faster PNG optimization than Pillow's optimize=True
+except ImportError:
+    oxipng = None
+
 def convert_to_serializable(obj):
     """Convert numpy types to JSON serializable types."""
     if isinstance(obj, np.integer):
@@ -34,8 +46,34 @@ def convert_to_serializable(obj):
         return obj.tolist()
     return obj
 
+def encode_png(image: Image.Image, compress_level: Optional[int] = None) -> bytes:
+    """
+    Encode an image as an optimized PNG.
+    
+    By default uses a plain level-6 Pillow encode followed by an oxipng pass
+    when oxipng is installed, otherwise Pillow's slower ``optimize=True``
+    encoder. An explicit ``compress_level`` trades file size for speed,
+    which is useful while iterating on assets.
+    
+    Args:
+        image: Image to encode
+        compress_level: zlib level 0-9, or None for the final optimized encode
+        
+    Returns:
+        PNG file contents
+    """
+    buffer = io.BytesIO()
+    if compress_level is not None:
+        image.save(buffer, "PNG", compress_level=compress_level, optimize=compress_level >= 9)
+        return buffer.getvalue()
+    if oxipng is None:
+        image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
+    image.save(buffer, "PNG", compress_level=6)
+    return oxipng.optimize_from_memory(buffer.getvalue(), level=2)
+
 class BoundingBox(NamedTuple):
-    """Represents the bounding box of non-transparent content."""
+    """Represents the bounding box of non-transparent content (plain Python ints)."""
     left: int
     top: int
     right: int
@@ -43,20 +81,20 @@ class BoundingBox(NamedTuple):
     
     @property
     def width(self) -> int:
-        return int(self.right - self.left)
+        return self.right - self.left
     
     @property
     def height(self) -> int:
-        return int(self.bottom - self.top)
+        return self.bottom - self.top
     
     def to_dict(self) -> Dict:
         return {
-            "left": int(self.left),
-            "top": int(self.top),
-            "right": int(self.right),
-            "bottom": int(self.bottom),
-            "width": int(self.width),
-            "height": int(self.height)
+            "left": self.left,
+            "top": self.top,
+            "right": self.right,
+            "bottom": self.bottom,
+            "width": self.width,
+            "height": self.height
         }
 
 class PieceOptimizationResult(NamedTuple):
@@ -64,21 +102,32 @@ class PieceOptimizationResult(NamedTuple):
     piece_id: str
     original_size: Tuple[int, int]
     bounds: BoundingBox
-    cropped_image: Image.Image
+    cropped_image: Optional[Image.Image]  # None once encoded by a worker process
     content_hash: str
     memory_saved_bytes: int
+    encode_key: str  # Full digest + dimensions, identifies byte-identical crops
 
 class PuzzleOptimizer:
     """Main puzzle optimization engine."""
     
-    def __init__(self, base_path: str, verbose: bool = False):
+    def __init__(self, base_path: str, verbose: bool = False, compress_level: Optional[int] = None):
         self.base_path = Path(base_path)
         self.verbose = verbose
+        self.compress_level = compress_level
+        # First output written for each PieceOptimizationResult.encode_key, shared
+        # across grid sizes so identical crops are only compressed once and later
+        # copies are hardlinked to it
+        self._encoded_paths: Dict[str, Path] = {}
+        
+    def log(self, message: str, *args) -> None:
+        """
+        Print log message if verbose is enabled.
         
-    def log(self, message: str) -> None:
-        """Print log message if verbose is enabled."""
+        Any args are applied with str.format only when the message is printed,
+        so hot paths can skip formatting entirely when not verbose.
+        """
         if self.verbose:
-            print(f"[PuzzleOptimizer] {message}")
+            print(f"[PuzzleOptimizer] {message.format(*args) if args else message}")
     
     def find_content_bounds(self, image: Image.Image) -> Optional[BoundingBox]:
         """
@@ -93,27 +142,16 @@ class PuzzleOptimizer:
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
         
-        # Convert to numpy array for fast processing
-        img_array = np.array(image)
-        alpha_channel = img_array[:, :, 3]  # Alpha channel
-        
-        # Find all non-transparent pixels
-        non_transparent = alpha_channel > 0
-        
-        if not np.any(non_transparent):
+        # Only the alpha band matters for bounds; Pillow's C getbbox() scans it
+        # natively without building any intermediate arrays
+        bbox = image.getchannel('A').getbbox()
+        if bbox is None:
             self.log(f"Warning: Image appears completely transparent")
             return None
         
-        # Find bounds of non-transparent pixels
-        rows = np.any(non_transparent, axis=1)
-        cols = np.any(non_transparent, axis=0)
-        
-        top = int(np.argmax(rows))
-        bottom = int(len(rows) - 1 - np.argmax(rows[::-1]))
-        left = int(np.argmax(cols))
-        right = int(len(cols) - 1 - np.argmax(cols[::-1]))
-        
-        return BoundingBox(int(left), int(top), int(right), int(bottom))
+        # getbbox() is half-open; BoundingBox right/bottom are inclusive
+        left, top, right, bottom = bbox
+        return BoundingBox(left, top, right - 1, bottom - 1)
     
     def crop_image_to_bounds(self, image: Image.Image, bounds: BoundingBox, padding: int = 2) -> Image.Image:
         """
@@ -125,7 +163,7 @@ class PuzzleOptimizer:
             padding: Extra pixels around content to avoid clipping
             
         Returns:
-            Cropped image
+            Cropped image (the source image itself if nothing is cropped away)
         """
         # Apply padding while staying within image bounds
         padded_left = max(0, bounds.left - padding)
@@ -133,14 +171,30 @@ class PuzzleOptimizer:
         padded_right = min(image.width - 1, bounds.right + padding)
         padded_bottom = min(image.height - 1, bounds.bottom + padding)
         
-        # Crop to padded bounds
+        # Crop to padded bounds; a box covering the whole image would only copy it
         crop_box = (padded_left, padded_top, padded_right + 1, padded_bottom + 1)
+        if crop_box == (0, 0, image.width, image.height):
+            return image
         return image.crop(crop_box)
     
     def calculate_content_hash(self, image: Image.Image) -> str:
         """Calculate SHA-256 hash of image content for verification."""
-        img_bytes = image.tobytes()
-        return hashlib.sha256(img_bytes).hexdigest()[:8]
+        return self.calculate_content_digest(image)[:8]
+    
+    def calculate_content_digest(self, image: Image.Image, band_rows: int = 64) -> str:
+        """
+        Calculate the full SHA-256 hex digest of image content.
+        
+        Pixels are fed to the hasher in bands of rows so only a small slice of
+        the raw buffer is materialized at a time; the digest is identical to
+        hashing ``image.tobytes()`` in one go.
+        """
+        hasher = hashlib.sha256()
+        width, height = image.size
+        for top in range(0, height, band_rows):
+            band = image.crop((0, top, width, min(top + band_rows, height)))
+            hasher.update(band.tobytes())
+        return hasher.hexdigest()
     
     def optimize_piece(self, piece_path: Path) -> Optional[PieceOptimizationResult]:
         """
@@ -154,32 +208,36 @@ class PuzzleOptimizer:
         """
         try:
             piece_id = piece_path.stem
-            self.log(f"Optimizing piece {piece_id}")
+            self.log("Optimizing piece {}", piece_id)
             
-            # Load original image
-            original_image = Image.open(piece_path).convert('RGBA')
+            # Load original image; convert() copies even when the mode already
+            # matches, so only convert pieces that aren't RGBA
+            original_image = Image.open(piece_path)
+            if original_image.mode != 'RGBA':
+                original_image = original_image.convert('RGBA')
             original_size = original_image.size
             original_bytes = original_size[0] * original_size[1] * 4  # RGBA = 4 bytes per pixel
             
             # Find content bounds
             bounds = self.find_content_bounds(original_image)
             if bounds is None:
-                self.log(f"Warning: Piece {piece_id} has no content, skipping")
+                self.log("Warning: Piece {} has no content, skipping", piece_id)
                 return None
             
             # Crop to content with small padding
             cropped_image = self.crop_image_to_bounds(original_image, bounds, padding=2)
             cropped_bytes = cropped_image.size[0] * cropped_image.size[1] * 4
             
-            # Calculate hash for verification
-            content_hash = self.calculate_content_hash(cropped_image)
+            # Calculate hash for verification; the full digest doubles as the
+            # dedup key for encoding, so only hash the pixels once
+            content_digest = self.calculate_content_digest(cropped_image)
+            content_hash = content_digest[:8]
             
-            memory_saved = int(original_bytes - cropped_bytes)
-            reduction_percent = float((memory_saved / original_bytes) * 100)
+            memory_saved = original_bytes - cropped_bytes
             
-            self.log(f"  Original: {original_size[0]}x{original_size[1]} ({original_bytes:,} bytes)")
-            self.log(f"  Cropped:  {cropped_image.size[0]}x{cropped_image.size[1]} ({cropped_bytes:,} bytes)")
-            self.log(f"  Saved:    {memory_saved:,} bytes ({reduction_percent:.1f}%)")
+            self.log("  Original: {}x{} ({:,} bytes)", original_size[0], original_size[1], original_bytes)
+            self.log("  Cropped:  {}x{} ({:,} bytes)", cropped_image.size[0], cropped_image.size[1], cropped_bytes)
+            self.log("  Saved:    {:,} bytes ({:.1f}%)", memory_saved, (memory_saved / original_bytes) * 100)
             
             return PieceOptimizationResult(
                 piece_id=piece_id,
@@ -187,7 +245,8 @@ class PuzzleOptimizer:
                 bounds=bounds,
                 cropped_image=cropped_image,
                 content_hash=content_hash,
-                memory_saved_bytes=memory_saved
+                memory_saved_bytes=memory_saved,
+                encode_key=f"{cropped_image.size[0]}x{cropped_image.size[1]}:{content_digest}"
             )
             
         except Exception as e:
@@ -226,37 +285,111 @@ class PuzzleOptimizer:
             shutil.copy2(original_layout, optimized_layout_path / "layout.ipuz.json")
             self.log(f"Copied layout.ipuz.json")
         
-        # Process all piece files
-        piece_files = list(pieces_path.glob("*.png"))
-        results = []
-        total_original_bytes = 0
-        total_saved_bytes = 0
-        
-        self.log(f"Processing {len(piece_files)} pieces...")
-        
-        for piece_file in sorted(piece_files):
-            result = self.optimize_piece(piece_file)
-            if result:
-                # Save optimized piece
+        # Process all piece files; order doesn't matter until metadata is emitted
+        piece_entries = [e for e in os.scandir(pieces_path) if e.name.endswith('.png') and e.is_file()]
+        results_by_id: Dict[str, PieceOptimizationResult] = {}
+        
+        # Reuse results for pieces whose source is unchanged since the last run
+        # and whose optimized output is still on disk. Caches from before the
+        # cache moved out of the asset directory would otherwise be bundled
+        # into the app, so drop them
+        (optimized_layout_path / ".cache.json").unlink(missing_ok=True)
+        cache_path = piece_cache_path(self.base_path, puzzle_id, grid_size)
+        cached_pieces = self._load_piece_cache(cache_path)
+        piece_cache: Dict[str, Dict] = {}
+        stamps: Dict[str, List[int]] = {}
+        stale_files = []
+        for dir_entry in piece_entries:
+            piece_file = Path(dir_entry.path)
+            stat = dir_entry.stat()
+            stamps[piece_file.stem] = [stat.st_mtime_ns, stat.st_size]
+            entry = cached_pieces.get(piece_file.stem)
+            if (entry is not None and entry["stamp"] == stamps[piece_file.stem]
+                    and (optimized_pieces_path / f"{piece_file.stem}.png").exists()):
+                results_by_id[piece_file.stem] = _result_from_cache_entry(piece_file.stem, entry)
+                piece_cache[piece_file.stem] = entry
+            else:
+                stale_files.append(piece_file)
+        
+        # Outputs of stale pieces are about to be rewritten, so an earlier run on
+        # this instance must not hand them out as link sources any more
+        stale_outputs = {optimized_pieces_path / f"{piece_file.stem}.png" for piece_file in stale_files}
+        self._encoded_paths = {key: path for key, path in self._encoded_paths.items()
+                               if path not in stale_outputs}
+        for piece_id, entry in piece_cache.items():
+            self._encoded_paths.setdefault(entry["encode_key"], optimized_pieces_path / f"{piece_id}.png")
+        
+        self.log(f"Processing {len(stale_files)} pieces ({len(results_by_id)} unchanged)...")
+        
+        # Pieces are independent and CPU-bound (decode, scan, PNG encode), so fan
+        # them out to worker processes. Workers return encoded PNG bytes rather
+        # than PIL images to keep inter-process traffic small, and skip encoding
+        # content already seen in a previous grid size.
+        # Pieces are shipped in batches so each worker round-trip covers several
+        # pieces instead of paying pickling/IPC overhead per piece.
+        tasks = [(str(self.base_path), self.verbose, self.compress_level, str(piece_file))
+                 for piece_file in stale_files]
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_piece_worker,
+                                 initargs=(frozenset(self._encoded_paths),)) as executor:
+            for outcome in executor.map(_optimize_piece_worker, tasks, chunksize=chunksize):
+                if outcome is None:
+                    continue
+                result, png_data = outcome
+                
+                # Save optimized piece, linking to an identical earlier output
+                # instead of storing the same bytes twice
                 output_path = optimized_pieces_path / f"{result.piece_id}.png"
-                result.cropped_image.save(output_path, "PNG", optimize=True)
+                source_path = self._encoded_paths.get(result.encode_key)
+                if source_path is None and png_data is None:
+                    # Nothing was cropped away, so the source already is the output
+                    source_path = pieces_path / f"{result.piece_id}.png"
+                if source_path != output_path:
+                    # Never write through a hardlink another piece may share
+                    output_path.unlink(missing_ok=True)
+                    if source_path is None:
+                        output_path.write_bytes(png_data)
+                    else:
+                        _link_or_copy(source_path, output_path)
+                    self._encoded_paths.setdefault(result.encode_key, output_path)
                 
-                results.append(result)
-                total_original_bytes += int(result.original_size[0] * result.original_size[1] * 4)
-                total_saved_bytes += int(result.memory_saved_bytes)
+                results_by_id[result.piece_id] = result
+                piece_cache[result.piece_id] = _cache_entry_for_result(result, stamps[result.piece_id])
         
+        # Sort by piece id so metadata is deterministic regardless of directory
+        # order or which pieces were cached
+        results = sorted(results_by_id.values(), key=lambda r: r.piece_id)
         if not results:
             self.log(f"Error: No pieces were successfully optimized")
             return False
         
+        total_original_bytes = sum(r.original_size[0] * r.original_size[1] * 4 for r in results)
+        total_saved_bytes = sum(r.memory_saved_bytes for r in results)
+        
+        # Record each output's size now, while the files are known to exist, so
+        # analysis and benchmarks can sum metadata instead of statting pieces
+        file_sizes = {entry.name[:-4]: entry.stat().st_size
+                      for entry in os.scandir(optimized_pieces_path)
+                      if entry.name.endswith('.png')}
+        
         # Generate optimization metadata
         canvas_info = self._load_canvas_info(source_layout_path / "layout.ipuz.json")
-        metadata = self._generate_optimization_metadata(results, canvas_info, total_original_bytes, total_saved_bytes)
+        metadata = self._generate_optimization_metadata(results, canvas_info, total_original_bytes,
+                                                        total_saved_bytes, file_sizes)
         
-        # Save metadata with custom encoder to handle numpy types
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({"tool": Path(__file__).stem, "compress_level": self.compress_level, "pieces": piece_cache}, f)
+        
+        # Metadata holds only plain Python values, so no custom encoder is needed
         metadata_path = optimized_layout_path / "optimization_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=convert_to_serializable)
+        if orjson:
+            metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2)
         
         total_reduction = (total_saved_bytes / total_original_bytes) * 100
         self.log(f"✅ Optimization complete!")
@@ -266,6 +399,32 @@ class PuzzleOptimizer:
         
         return True
     
+    def _load_piece_cache(self, cache_path: Path) -> Dict[str, Dict]:
+        """
+        Load per-piece results recorded by a previous run.
+        
+        Entries are only valid for the same tool and encoder settings, so a
+        cache written by another optimizer sharing this output directory, or
+        with a different compress level, is ignored.
+        
+        Args:
+            cache_path: Path to the grid's piece cache (see piece_cache_path)
+            
+        Returns:
+            Mapping of piece id to cache entry (empty if missing or unusable)
+        """
+        if not cache_path.exists():
+            return {}
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+            if cache.get('tool') != Path(__file__).stem or cache.get('compress_level') != self.compress_level:
+                return {}
+            return cache.get('pieces', {})
+        except Exception as e:
+            self.log(f"Warning: Ignoring unreadable piece cache {cache_path}: {e}")
+            return {}
+    
     def _load_canvas_info(self, layout_path: Path) -> Dict:
         """Load canvas information from layout.ipuz.json."""
         try:
@@ -278,44 +437,36 @@ class PuzzleOptimizer:
     
     def _generate_optimization_metadata(self, results: List[PieceOptimizationResult], 
                                        canvas_info: Dict, total_original_bytes: int, 
-                                       total_saved_bytes: int) -> Dict:
+                                       total_saved_bytes: int, file_sizes: Dict[str, int]) -> Dict:
         """Generate the optimization metadata JSON."""
         pieces_metadata = {}
+        # The asset loader reads canvas_size per piece, so keep it there but
+        # share one dict rather than building a copy for every piece
+        canvas_size = {
+            "width": int(canvas_info['width']),
+            "height": int(canvas_info['height'])
+        }
         
         for result in results:
-            # Convert all numeric values to standard Python types for JSON serialization
-            bounds_dict = {
-                "left": int(result.bounds.left),
-                "top": int(result.bounds.top),
-                "right": int(result.bounds.right),
-                "bottom": int(result.bounds.bottom),
-                "width": int(result.bounds.width),
-                "height": int(result.bounds.height)
-            }
-            
             pieces_metadata[result.piece_id] = {
-                "bounds": bounds_dict,
-                "canvas_size": {
-                    "width": int(canvas_info['width']),
-                    "height": int(canvas_info['height'])
-                },
+                "bounds": result.bounds.to_dict(),
+                "canvas_size": canvas_size,
                 "content_hash": result.content_hash,
-                "cropped_filename": f"{result.piece_id}.png"
+                "cropped_filename": f"{result.piece_id}.png",
+                "size": file_sizes[result.piece_id],
+                "decoded_bytes": result.original_size[0] * result.original_size[1] * 4 - result.memory_saved_bytes
             }
         
         return {
             "version": "1.0",
-            "canvas_size": {
-                "width": int(canvas_info['width']),
-                "height": int(canvas_info['height'])
-            },
+            "canvas_size": canvas_size,
             "pieces": pieces_metadata,
             "statistics": {
-                "memory_reduction_percent": float((total_saved_bytes / total_original_bytes) * 100) if total_original_bytes > 0 else 0.0,
-                "total_pieces": int(len(results)),
-                "original_total_bytes": int(total_original_bytes),
-                "optimized_total_bytes": int(total_original_bytes - total_saved_bytes),
-                "bytes_saved": int(total_saved_bytes)
+                "memory_reduction_percent": (total_saved_bytes / total_original_bytes) * 100 if total_original_bytes > 0 else 0.0,
+                "total_pieces": len(results),
+                "original_total_bytes": total_original_bytes,
+                "optimized_total_bytes": total_original_bytes - total_saved_bytes,
+                "bytes_saved": total_saved_bytes
             }
         }
     
@@ -399,11 +550,95 @@ class PuzzleOptimizer:
                     print(f"  Optimized memory: ~{optimized_memory_mb:.0f} MB")
                     print(f"  Memory saved: ~{saved_mb:.0f} MB ({reduction:.1f}%)")
                     
+                    # Older metadata has no per-piece sizes; skip rather than stat files
+                    pieces = metadata.get('pieces', {}).values()
+                    if pieces and all('size' in piece for piece in pieces):
+                        disk_mb = sum(piece['size'] for piece in pieces) / (1024 * 1024)
+                        print(f"  Optimized files on disk: {disk_mb:.1f} MB")
+                    
                 except Exception as e:
                     print(f"  Error reading optimization metadata: {e}")
             else:
                 print(f"  Status: Not optimized")
 
+def piece_cache_path(base_path: Path, puzzle_id: str, grid_size: str) -> Path:
+    """
+    Location of the incremental piece cache for one grid's optimized output.
+    
+    The cache lives under tools/.cache rather than in {grid}_optimized/,
+    which pubspec.yaml lists as an asset directory; Flutter bundles every file
+    there, dotfiles included.
+    
+    Args:
+        base_path: Base path to the puzzle game project
+        puzzle_id: Puzzle identifier
+        grid_size: Grid size (e.g., "8x8", "12x12")
+        
+    Returns:
+        Path of the cache JSON file (its directory may not exist yet)
+    """
+    return Path(base_path) / "tools" / ".cache" / puzzle_id / f"{grid_size}_optimized.json"
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hardlink destination to source, copying where links aren't supported."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+def _cache_entry_for_result(result: PieceOptimizationResult, stamp: List[int]) -> Dict:
+    """Build the piece cache entry for a piece from its source stamp and result."""
+    return {
+        "stamp": stamp,
+        "original_size": list(result.original_size),
+        "bounds": [result.bounds.left, result.bounds.top, result.bounds.right, result.bounds.bottom],
+        "content_hash": result.content_hash,
+        "memory_saved_bytes": result.memory_saved_bytes,
+        "encode_key": result.encode_key
+    }
+
+def _result_from_cache_entry(piece_id: str, entry: Dict) -> PieceOptimizationResult:
+    """Rebuild a piece's optimization result from its piece cache entry."""
+    return PieceOptimizationResult(
+        piece_id=piece_id,
+        original_size=tuple(entry["original_size"]),
+        bounds=BoundingBox(*entry["bounds"]),
+        cropped_image=None,
+        content_hash=entry["content_hash"],
+        memory_saved_bytes=entry["memory_saved_bytes"],
+        encode_key=entry["encode_key"]
+    )
+
+# Encode keys the parent has already written an output for, set once per worker process
+_known_encode_keys: frozenset = frozenset()
+
+def _init_piece_worker(known_encode_keys: frozenset) -> None:
+    """Process-pool initializer: record which encode keys the parent has written."""
+    global _known_encode_keys
+    _known_encode_keys = known_encode_keys
+
+def _optimize_piece_worker(task: Tuple[str, bool, Optional[int], str]) -> Optional[Tuple[PieceOptimizationResult, Optional[bytes]]]:
+    """
+    Process-pool entry point: optimize a single piece and encode it as PNG.
+    
+    Args:
+        task: (base_path, verbose, compress_level, piece_path) tuple
+        
+    Returns:
+        The optimization result (without its image) and the encoded PNG bytes,
+        or None if the piece could not be optimized. The bytes are None when
+        no encode is needed: the parent has already written this content, or
+        nothing was cropped away and the source file can be linked as-is.
+    """
+    base_path, verbose, compress_level, piece_path = task
+    result = PuzzleOptimizer(base_path, verbose, compress_level).optimize_piece(Path(piece_path))
+    if result is None:
+        return None
+    if result.encode_key in _known_encode_keys or result.cropped_image.size == result.original_size:
+        return result._replace(cropped_image=None), None
+    
+    return result._replace(cropped_image=None), encode_png(result.cropped_image, compress_level)
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(
@@ -422,6 +657,9 @@ Examples:
   
   # Verbose output
   python optimize_puzzle_assets.py sample_puzzle_01 --verbose
+  
+  # Fast encode while iterating (larger files)
+  python optimize_puzzle_assets.py sample_puzzle_01 --compress-level 1
         """
     )
     
@@ -430,11 +668,13 @@ Examples:
     parser.add_argument('--analyze-only', action='store_true', help='Only analyze memory usage')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--base-path', default='.', help='Base path to puzzle game project')
+    parser.add_argument('--compress-level', type=int, choices=range(10), metavar='0-9',
+                        help='zlib level for a fast PNG encode (default: fully optimized encode)')
     
     args = parser.parse_args()
     
     # Initialize optimizer
-    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose)
+    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose, compress_level=args.compress_level)
     
     if args.analyze_only:
         optimizer.analyze_memory_usage(args.puzzle_id)
@@ -5,6 +5,11 @@ FIXED Puzzle Asset Optimization Tool
 Key Fix: Metadata now reflects actual cropped image dimensions and positioning,
 not the original content bounds. This eliminates the padding mismatch that
 was causing gaps in Flutter rendering.
+
+Performance: the hot path is Pillow's RGBA convert, crop and PNG encode. Pillow-SIMD
+is a drop-in replacement that vectorizes these on AVX2 hardware; install it in place
+of Pillow (no code changes needed):
+    pip uninstall pillow && CC="cc -mavx2" pip install --no-binary :all: pillow-simd
 """
 
 import os
@@ -12,24 +17,96 @@ import sys
 import json
 import argparse
 import hashlib
+import io
 import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import Manager
 from typing import Dict, List, Tuple, Optional, NamedTuple
 from pathlib import Path
 import numpy as np
 from PIL import Image
 
-def convert_to_serializable(obj):
-    """Convert numpy types to JSON serializable types."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    return obj
+try:
+    from numba import njit, types as numba_types  # Optional: native early-exit bounds scan
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # Optional: faster metadata serialization
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=None)
+def _read_layout_json(path_str: str, mtime_ns: int) -> Dict:
+    """
+    Parse a layout.ipuz.json file, memoized per path and modification time.
+    
+    Callers must treat the returned dict as read-only since it is shared.
+    """
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _scan_alpha_bounds(alpha):
+    """
+    Scan an alpha plane for its nonzero bounds, reading only the margins.
+    
+    Rows are scanned inward from the top and bottom until content is found;
+    within the content band each row is only scanned up to the best left and
+    right found so far, so fully transparent padding is touched once.
+    
+    Args:
+        alpha: C-contiguous 2-D uint8 alpha plane
+        
+    Returns:
+        (top, bottom, left, right) inclusive, or all -1 if the plane is empty
+    """
+    height, width = alpha.shape
+    top = -1
+    for y in range(height):
+        for x in range(width):
+            if alpha[y, x]:
+                top = y
+                break
+        if top >= 0:
+            break
+    if top < 0:
+        return -1, -1, -1, -1
+    
+    bottom = top
+    for y in range(height - 1, top, -1):
+        for x in range(width):
+            if alpha[y, x]:
+                bottom = y
+                break
+        if bottom > top:
+            break
+    
+    left = width
+    right = -1
+    for y in range(top, bottom + 1):
+        for x in range(left):
+            if alpha[y, x]:
+                left = x
+                break
+        for x in range(width - 1, right, -1):
+            if alpha[y, x]:
+                right = x
+                break
+    return top, bottom, left, right
+
+# Compiled eagerly for contiguous uint8 planes, both writable and the read-only
+# views np.asarray(image.getchannel('A')) returns; without numba,
+# find_content_bounds uses numpy reductions instead
+_bounds_kernel = (njit([numba_types.UniTuple(numba_types.int64, 4)(
+                            numba_types.Array(numba_types.uint8, 2, 'C', readonly=readonly))
+                        for readonly in (False, True)], cache=True)(_scan_alpha_bounds)
+                  if njit is not None else None)
 
 class BoundingBox(NamedTuple):
-    """Represents the bounding box of non-transparent content."""
+    """Represents the bounding box of non-transparent content (plain Python ints)."""
     left: int
     top: int
     right: int
@@ -37,29 +114,30 @@ class BoundingBox(NamedTuple):
     
     @property
     def width(self) -> int:
-        return int(self.right - self.left)
+        return self.right - self.left
     
     @property
     def height(self) -> int:
-        return int(self.bottom - self.top)
+        return self.bottom - self.top
     
     def to_dict(self) -> Dict:
         return {
-            "left": int(self.left),
-            "top": int(self.top),
-            "right": int(self.right),
-            "bottom": int(self.bottom),
-            "width": int(self.width),
-            "height": int(self.height)
+            "left": self.left,
+            "top": self.top,
+            "right": self.right,
+            "bottom": self.bottom,
+            "width": self.width,
+            "height": self.height
         }
 
 class CroppedImageInfo(NamedTuple):
     """Information about the cropped image and its positioning."""
-    cropped_image: Image.Image
+    cropped_image: Optional[Image.Image]  # None once encoded by a worker process
     original_content_bounds: BoundingBox  # Original content detection bounds
     actual_crop_bounds: BoundingBox       # Actual bounds used for cropping (with padding)
     canvas_position_left: int             # Where to position this cropped image on canvas
     canvas_position_top: int              # Where to position this cropped image on canvas
+    is_noop: bool                         # Crop covers the whole image (nothing removed)
 
 class PieceOptimizationResult(NamedTuple):
     """Result of optimizing a single piece."""
@@ -68,53 +146,56 @@ class PieceOptimizationResult(NamedTuple):
     cropped_info: CroppedImageInfo
     content_hash: str
     memory_saved_bytes: int
+    encode_key: str  # Full digest + dimensions, identifies byte-identical crops
 
 class PuzzleOptimizer:
     """Main puzzle optimization engine."""
     
-    def __init__(self, base_path: str, verbose: bool = False):
+    def __init__(self, base_path: str, verbose: bool = False, recompress: bool = False):
         self.base_path = Path(base_path)
         self.verbose = verbose
+        self.recompress = recompress
         
     def log(self, message: str) -> None:
         """Print log message if verbose is enabled."""
         if self.verbose:
             print(f"[PuzzleOptimizer] {message}")
     
-    def find_content_bounds(self, image: Image.Image) -> Optional[BoundingBox]:
+    def find_content_bounds(self, alpha_channel: np.ndarray) -> Optional[BoundingBox]:
         """
-        Find the bounding box of non-transparent pixels in an RGBA image.
+        Find the bounding box of non-transparent pixels from an alpha plane.
         
         Args:
-            image: PIL Image in RGBA format
+            alpha_channel: 2-D uint8 alpha values (e.g. from image.getchannel('A'))
             
         Returns:
             BoundingBox of content or None if image is completely transparent
         """
-        if image.mode != 'RGBA':
-            image = image.convert('RGBA')
-        
-        # Convert to numpy array for fast processing
-        img_array = np.array(image)
-        alpha_channel = img_array[:, :, 3]  # Alpha channel
-        
-        # Find all non-transparent pixels
-        non_transparent = alpha_channel > 0
+        if _bounds_kernel is not None:
+            top, bottom, left, right = _bounds_kernel(np.ascontiguousarray(alpha_channel, dtype=np.uint8))
+            if top < 0:
+                self.log(f"Warning: Image appears completely transparent")
+                return None
+            return BoundingBox(left, top, right, bottom)
         
-        if not np.any(non_transparent):
+        # Reduce the alpha plane straight to 1-D row/column flags; any() treats
+        # nonzero as True, so no full-size boolean mask is needed
+        rows = alpha_channel.any(axis=1)
+        if not rows.any():
             self.log(f"Warning: Image appears completely transparent")
             return None
         
-        # Find bounds of non-transparent pixels
-        rows = np.any(non_transparent, axis=1)
-        cols = np.any(non_transparent, axis=0)
-        
+        # Cast numpy indices once here so everything downstream is plain ints
         top = int(np.argmax(rows))
         bottom = int(len(rows) - 1 - np.argmax(rows[::-1]))
+        
+        # Columns only need checking within the content's row band; on sparse
+        # pieces this skips most of the plane for the second reduction
+        cols = alpha_channel[top:bottom + 1].any(axis=0)
         left = int(np.argmax(cols))
         right = int(len(cols) - 1 - np.argmax(cols[::-1]))
         
-        return BoundingBox(int(left), int(top), int(right), int(bottom))
+        return BoundingBox(left, top, right, bottom)
     
     def create_optimized_crop(self, image: Image.Image, content_bounds: BoundingBox, 
                             padding: int = 2) -> CroppedImageInfo:
@@ -137,7 +218,8 @@ class PuzzleOptimizer:
         
         # Create the crop box for PIL (left, top, right, bottom) - right/bottom are exclusive
         crop_box = (crop_left, crop_top, crop_right, crop_bottom)
-        cropped_image = image.crop(crop_box)
+        is_noop = crop_box == (0, 0, image.width, image.height)
+        cropped_image = image if is_noop else image.crop(crop_box)
         
         # Calculate the actual crop bounds that were used
         actual_crop_bounds = BoundingBox(
@@ -163,13 +245,28 @@ class PuzzleOptimizer:
             original_content_bounds=content_bounds,
             actual_crop_bounds=actual_crop_bounds,
             canvas_position_left=canvas_position_left,
-            canvas_position_top=canvas_position_top
+            canvas_position_top=canvas_position_top,
+            is_noop=is_noop
         )
     
     def calculate_content_hash(self, image: Image.Image) -> str:
         """Calculate SHA-256 hash of image content for verification."""
-        img_bytes = image.tobytes()
-        return hashlib.sha256(img_bytes).hexdigest()[:8]
+        return self.calculate_content_digest(image)[:8]
+    
+    def calculate_content_digest(self, image: Image.Image, band_rows: int = 64) -> str:
+        """
+        Calculate the full SHA-256 hex digest of image content.
+        
+        Pixels are fed to the hasher in bands of rows so only a small slice of
+        the raw buffer is materialized at a time; the digest is identical to
+        hashing ``image.tobytes()`` in one go.
+        """
+        hasher = hashlib.sha256()
+        width, height = image.size
+        for top in range(0, height, band_rows):
+            band = image.crop((0, top, width, min(top + band_rows, height)))
+            hasher.update(band.tobytes())
+        return hasher.hexdigest()
     
     def optimize_piece(self, piece_path: Path) -> Optional[PieceOptimizationResult]:
         """
@@ -186,12 +283,15 @@ class PuzzleOptimizer:
             self.log(f"Optimizing piece {piece_id}")
             
             # Load original image
-            original_image = Image.open(piece_path).convert('RGBA')
+            original_image = Image.open(piece_path)
+            if original_image.mode != 'RGBA':
+                original_image = original_image.convert('RGBA')
             original_size = original_image.size
             original_bytes = original_size[0] * original_size[1] * 4  # RGBA = 4 bytes per pixel
             
-            # Find content bounds
-            content_bounds = self.find_content_bounds(original_image)
+            # Find content bounds from the alpha band alone (1 byte per pixel)
+            alpha_channel = np.asarray(original_image.getchannel('A'))
+            content_bounds = self.find_content_bounds(alpha_channel)
             if content_bounds is None:
                 self.log(f"Warning: Piece {piece_id} has no content, skipping")
                 return None
@@ -200,11 +300,13 @@ class PuzzleOptimizer:
             cropped_info = self.create_optimized_crop(original_image, content_bounds, padding=2)
             cropped_bytes = cropped_info.cropped_image.size[0] * cropped_info.cropped_image.size[1] * 4
             
-            # Calculate hash for verification
-            content_hash = self.calculate_content_hash(cropped_info.cropped_image)
+            # Calculate hash for verification; the full digest doubles as the
+            # dedup key for encoding, so only hash the pixels once
+            content_digest = self.calculate_content_digest(cropped_info.cropped_image)
+            content_hash = content_digest[:8]
             
-            memory_saved = int(original_bytes - cropped_bytes)
-            reduction_percent = float((memory_saved / original_bytes) * 100)
+            memory_saved = original_bytes - cropped_bytes
+            reduction_percent = (memory_saved / original_bytes) * 100
             
             self.log(f"  Original: {original_size[0]}x{original_size[1]} ({original_bytes:,} bytes)")
             self.log(f"  Cropped:  {cropped_info.cropped_image.size[0]}x{cropped_info.cropped_image.size[1]} ({cropped_bytes:,} bytes)")
@@ -215,7 +317,8 @@ class PuzzleOptimizer:
                 original_size=original_size,
                 cropped_info=cropped_info,
                 content_hash=content_hash,
-                memory_saved_bytes=memory_saved
+                memory_saved_bytes=memory_saved,
+                encode_key=f"{cropped_info.cropped_image.size[0]}x{cropped_info.cropped_image.size[1]}:{content_digest}"
             )
             
         except Exception as e:
@@ -256,107 +359,180 @@ class PuzzleOptimizer:
         
         # Process all piece files
         piece_files = list(pieces_path.glob("*.png"))
-        results = []
+        canvas_info = self._load_canvas_info(source_layout_path / "layout.ipuz.json")
+        pieces_metadata: Dict[str, Dict] = {}
         total_original_bytes = 0
         total_saved_bytes = 0
         
         self.log(f"Processing {len(piece_files)} pieces...")
         
-        for piece_file in sorted(piece_files):
-            result = self.optimize_piece(piece_file)
-            if result:
-                # Save optimized piece
-                output_path = optimized_pieces_path / f"{result.piece_id}.png"
-                result.cropped_info.cropped_image.save(output_path, "PNG", optimize=True)
-                
-                results.append(result)
-                total_original_bytes += int(result.original_size[0] * result.original_size[1] * 4)
-                total_saved_bytes += int(result.memory_saved_bytes)
-        
-        if not results:
+        # Pieces are independent and CPU-bound (decode, scan, PNG encode), so fan
+        # them out to worker processes. Workers return encoded PNG bytes rather
+        # than PIL images to keep inter-process traffic small. Workers claim each
+        # distinct crop in a shared registry so only the first copy is encoded.
+        # Pieces are shipped in batches sized to the grid so each worker
+        # round-trip covers several pieces without starving other workers.
+        # Largest files go first so long-running pieces don't trail at the end.
+        piece_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+        tasks = [(str(self.base_path), self.verbose, str(piece_file)) for piece_file in piece_files]
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (workers * 4))
+        hash_to_path: Dict[str, Path] = {}
+        encoded_outputs: List[Path] = []
+        duplicates: List[Tuple[str, Path]] = []
+        with Manager() as manager:
+            encode_claims = manager.dict()
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_piece_worker,
+                                     initargs=(encode_claims,)) as executor:
+                for outcome in executor.map(_optimize_piece_worker, tasks, chunksize=chunksize):
+                    if outcome is None:
+                        continue
+                    result, png_data = outcome
+                    
+                    # Save optimized piece; uncropped pieces are copied as-is.
+                    # Existing outputs are removed first so a write never goes
+                    # through a hardlink shared with another piece.
+                    output_path = optimized_pieces_path / f"{result.piece_id}.png"
+                    output_path.unlink(missing_ok=True)
+                    if result.cropped_info.is_noop:
+                        shutil.copy2(pieces_path / f"{result.piece_id}.png", output_path)
+                        hash_to_path.setdefault(result.encode_key, output_path)
+                    elif png_data is None:
+                        # Another worker encoded this crop; link once it's written
+                        duplicates.append((result.encode_key, output_path))
+                    else:
+                        output_path.write_bytes(png_data)
+                        hash_to_path[result.encode_key] = output_path
+                        encoded_outputs.append(output_path)
+                    
+                    # Build metadata as results stream in rather than in a second pass
+                    pieces_metadata[result.piece_id] = self._piece_metadata(result, canvas_info)
+                    total_original_bytes += result.original_size[0] * result.original_size[1] * 4
+                    total_saved_bytes += result.memory_saved_bytes
+        
+        # Only recompress the files this run encoded, before duplicates are
+        # linked or copied from them; passing duplicates too would have oxipng
+        # rewrite one inode several times in parallel. Uncropped pieces are
+        # left byte-identical to their sources.
+        if self.recompress and encoded_outputs:
+            self._recompress_pieces(encoded_outputs)
+        
+        for encode_key, output_path in duplicates:
+            try:
+                os.link(hash_to_path[encode_key], output_path)
+            except OSError:
+                shutil.copy2(hash_to_path[encode_key], output_path)
+        
+        if not pieces_metadata:
             self.log(f"Error: No pieces were successfully optimized")
             return False
         
         # Generate optimization metadata
-        canvas_info = self._load_canvas_info(source_layout_path / "layout.ipuz.json")
-        metadata = self._generate_optimization_metadata(results, canvas_info, total_original_bytes, total_saved_bytes)
+        metadata = self._generate_optimization_metadata(pieces_metadata, canvas_info, total_original_bytes, total_saved_bytes)
         
-        # Save metadata with custom encoder to handle numpy types
+        # Bounds and totals are built from plain Python ints, so no custom
+        # encoder is needed
         metadata_path = optimized_layout_path / "optimization_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=convert_to_serializable)
+        if orjson:
+            metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2)
         
         total_reduction = (total_saved_bytes / total_original_bytes) * 100
         self.log(f"✅ Optimization complete!")
-        self.log(f"   Pieces optimized: {len(results)}")
+        self.log(f"   Pieces optimized: {len(pieces_metadata)}")
         self.log(f"   Memory reduction: {total_saved_bytes:,} bytes ({total_reduction:.1f}%)")
         self.log(f"   Output directory: {optimized_layout_path}")
         
         return True
     
+    def _recompress_pieces(self, piece_paths: List[Path]) -> None:
+        """
+        Losslessly shrink saved pieces with oxipng as a separate size pass.
+        
+        Pieces are first written with a fast zlib encode; this pass trades
+        build time for smaller files. oxipng processes the files in parallel.
+        
+        Args:
+            piece_paths: Optimized piece PNGs to recompress in place
+        """
+        oxipng = shutil.which("oxipng")
+        if oxipng is None:
+            self.log(f"Warning: oxipng not found on PATH, skipping recompression")
+            return
+        
+        self.log(f"Recompressing {len(piece_paths)} pieces with oxipng...")
+        try:
+            subprocess.run([oxipng, "-o", "4", "--strip", "safe", "--quiet", *map(str, piece_paths)],
+                           check=True)
+        except subprocess.CalledProcessError as e:
+            self.log(f"Warning: oxipng recompression failed: {e}")
+    
     def _load_canvas_info(self, layout_path: Path) -> Dict:
         """Load canvas information from layout.ipuz.json."""
         try:
-            with open(layout_path, 'r') as f:
-                layout_data = json.load(f)
+            layout_data = _read_layout_json(str(layout_path), layout_path.stat().st_mtime_ns)
             return layout_data.get('canvas', {'width': 2048, 'height': 2048})
         except Exception as e:
             self.log(f"Warning: Could not load canvas info from {layout_path}: {e}")
             return {'width': 2048, 'height': 2048}
     
-    def _generate_optimization_metadata(self, results: List[PieceOptimizationResult], 
-                                       canvas_info: Dict, total_original_bytes: int, 
-                                       total_saved_bytes: int) -> Dict:
-        """Generate the optimization metadata JSON with CORRECTED bounds."""
-        pieces_metadata = {}
+    def _piece_metadata(self, result: PieceOptimizationResult, canvas_info: Dict) -> Dict:
+        """Build one piece's metadata entry with CORRECTED bounds."""
+        cropped_info = result.cropped_info
+        crop_bounds = cropped_info.actual_crop_bounds
+        
+        # CRITICAL FIX: Use actual cropped image dimensions and positioning
+        # This ensures metadata matches the actual saved image file.
+        # Crop bounds are inclusive, so they span the saved image exactly.
+        actual_width = crop_bounds.right - crop_bounds.left + 1
+        actual_height = crop_bounds.bottom - crop_bounds.top + 1
+        canvas_left = cropped_info.canvas_position_left
+        canvas_top = cropped_info.canvas_position_top
+        canvas_right = canvas_left + actual_width - 1  # Convert to inclusive bounds
+        canvas_bottom = canvas_top + actual_height - 1  # Convert to inclusive bounds
+        
+        bounds_dict = {
+            "left": canvas_left,
+            "top": canvas_top,
+            "right": canvas_right,
+            "bottom": canvas_bottom,
+            "width": actual_width,      # FIXED: Use actual cropped image width
+            "height": actual_height     # FIXED: Use actual cropped image height
+        }
         
-        for result in results:
-            cropped_info = result.cropped_info
-            cropped_image = cropped_info.cropped_image
-            
-            # CRITICAL FIX: Use actual cropped image dimensions and positioning
-            # This ensures metadata matches the actual saved image file
-            actual_width = cropped_image.size[0]
-            actual_height = cropped_image.size[1]
-            canvas_left = cropped_info.canvas_position_left
-            canvas_top = cropped_info.canvas_position_top
-            canvas_right = canvas_left + actual_width - 1  # Convert to inclusive bounds
-            canvas_bottom = canvas_top + actual_height - 1  # Convert to inclusive bounds
-            
-            bounds_dict = {
-                "left": int(canvas_left),
-                "top": int(canvas_top),
-                "right": int(canvas_right),
-                "bottom": int(canvas_bottom),
-                "width": int(actual_width),      # FIXED: Use actual cropped image width
-                "height": int(actual_height)     # FIXED: Use actual cropped image height
-            }
-            
-            pieces_metadata[result.piece_id] = {
-                "bounds": bounds_dict,
-                "canvas_size": {
-                    "width": int(canvas_info['width']),
-                    "height": int(canvas_info['height'])
-                },
-                "content_hash": result.content_hash,
-                "cropped_filename": f"{result.piece_id}.png"
-            }
-            
-            self.log(f"Piece {result.piece_id}: bounds={bounds_dict}, actual_size={actual_width}x{actual_height}")
+        self.log(f"Piece {result.piece_id}: bounds={bounds_dict}, actual_size={actual_width}x{actual_height}")
         
+        return {
+            "bounds": bounds_dict,
+            "canvas_size": {
+                "width": int(canvas_info['width']),
+                "height": int(canvas_info['height'])
+            },
+            "content_hash": result.content_hash,
+            "cropped_filename": f"{result.piece_id}.png"
+        }
+    
+    def _generate_optimization_metadata(self, pieces_metadata: Dict[str, Dict],
+                                       canvas_info: Dict, total_original_bytes: int, 
+                                       total_saved_bytes: int) -> Dict:
+        """Assemble the optimization metadata JSON from per-piece entries."""
         return {
             "version": "1.0",
             "canvas_size": {
                 "width": int(canvas_info['width']),
                 "height": int(canvas_info['height'])
             },
-            "pieces": pieces_metadata,
+            # Pieces arrive in scheduling order; sort by id for deterministic output
+            "pieces": dict(sorted(pieces_metadata.items())),
             "statistics": {
-                "memory_reduction_percent": float((total_saved_bytes / total_original_bytes) * 100) if total_original_bytes > 0 else 0.0,
-                "total_pieces": int(len(results)),
-                "original_total_bytes": int(total_original_bytes),
-                "optimized_total_bytes": int(total_original_bytes - total_saved_bytes),
-                "bytes_saved": int(total_saved_bytes)
+                "memory_reduction_percent": (total_saved_bytes / total_original_bytes) * 100 if total_original_bytes > 0 else 0.0,
+                "total_pieces": len(pieces_metadata),
+                "original_total_bytes": total_original_bytes,
+                "optimized_total_bytes": total_original_bytes - total_saved_bytes,
+                "bytes_saved": total_saved_bytes
             }
         }
     
@@ -445,6 +621,42 @@ class PuzzleOptimizer:
             else:
                 print(f"  Status: Not optimized")
 
+# Shared encode_key -> piece_id registry, set once per worker process
+_encode_claims = None
+
+def _init_piece_worker(encode_claims) -> None:
+    """Process-pool initializer: attach the shared encode claim registry."""
+    global _encode_claims
+    _encode_claims = encode_claims
+
+def _optimize_piece_worker(task: Tuple[str, bool, str]) -> Optional[Tuple[PieceOptimizationResult, Optional[bytes]]]:
+    """
+    Process-pool entry point: optimize a single piece and encode it as PNG.
+    
+    Args:
+        task: (base_path, verbose, piece_path) tuple
+        
+    Returns:
+        The optimization result (without its image) and the encoded PNG bytes,
+        or None if the piece could not be optimized. The bytes are None when
+        nothing was cropped (the source file can be copied as-is) or when
+        another piece with identical content claimed the encode.
+    """
+    base_path, verbose, piece_path = task
+    result = PuzzleOptimizer(base_path, verbose).optimize_piece(Path(piece_path))
+    if result is None:
+        return None
+    owner = _encode_claims.setdefault(result.encode_key, result.piece_id)
+    if result.cropped_info.is_noop or owner != result.piece_id:
+        return result._replace(cropped_info=result.cropped_info._replace(cropped_image=None)), None
+    
+    buffer = io.BytesIO()
+    # A default-effort encode is several times faster than optimize=True;
+    # size is recovered separately by --recompress when it matters
+    result.cropped_info.cropped_image.save(buffer, "PNG", compress_level=6)
+    cropped_info = result.cropped_info._replace(cropped_image=None)
+    return result._replace(cropped_info=cropped_info), buffer.getvalue()
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(
@@ -463,6 +675,9 @@ Examples:
   
   # Verbose output
   python optimize_puzzle_assets_fixed.py sample_puzzle_01 --verbose
+  
+  # Smaller files for release builds (requires oxipng)
+  python optimize_puzzle_assets_fixed.py sample_puzzle_01 --recompress
         """
     )
     
@@ -471,11 +686,13 @@ Examples:
     parser.add_argument('--analyze-only', action='store_true', help='Only analyze memory usage')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--base-path', default='.', help='Base path to puzzle game project')
+    parser.add_argument('--recompress', action='store_true',
+                        help='Losslessly shrink saved pieces with oxipng (must be on PATH)')
     
     args = parser.parse_args()
     
     # Initialize optimizer
-    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose)
+    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose, recompress=args.recompress)
     
     if args.analyze_only:
         optimizer.analyze_memory_usage(args.puzzle_id)
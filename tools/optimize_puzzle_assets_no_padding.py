@@ -12,21 +12,108 @@ import sys
 import json
 import argparse
 import hashlib
+import io
+import re
 import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, NamedTuple
 from pathlib import Path
 import numpy as np
 from PIL import Image
 
-def convert_to_serializable(obj):
-    """Convert numpy types to JSON serializable types."""
-    if isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    return obj
+from optimize_puzzle_assets import piece_cache_path
+
+try:
+    from numba import njit  # Optional: native early-exit bounds scan
+except ImportError:
+    njit = None
+
+try:
+    import orjson  # Optional: faster metadata serialization
+except ImportError:
+    orjson = None
+
+try:
+    import pyspng  # Optional: libspng decoder, faster than Pillow's libpng
+except ImportError:
+    pyspng = None
+
+# zlib level per --png-effort; only "max" also runs Pillow's slow optimize pass
+PNG_EFFORT_LEVELS = {"fast": 1, "default": 6, "max": 9}
+
+def _is_rgba8_png(data: bytes) -> bool:
+    """Check the IHDR of PNG data for 8-bit truecolor with alpha (colour type 6)."""
+    return data[12:16] == b'IHDR' and data[24] == 8 and data[25] == 6
+
+def _natural_sort_key(name: str) -> Tuple:
+    """Sort key that orders embedded numbers numerically ("0_2" before "0_10")."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name))
+
+@lru_cache(maxsize=None)
+def _read_layout_json(path_str: str, mtime_ns: int) -> Dict:
+    """
+    Parse a layout.ipuz.json file, memoized per path and modification time.
+    
+    Callers must treat the returned dict as read-only since it is shared.
+    """
+    with open(path_str, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _scan_alpha_bounds(alpha):
+    """
+    Scan an alpha plane for its nonzero bounds, reading only the margins.
+    
+    Rows are scanned inward from the top and bottom until content is found;
+    within the content band each row is only scanned up to the best left and
+    right found so far, so fully transparent padding is touched once.
+    
+    Args:
+        alpha: C-contiguous 2-D uint8 alpha plane
+        
+    Returns:
+        (top, bottom, left, right) inclusive, or all -1 if the plane is empty
+    """
+    height, width = alpha.shape
+    top = -1
+    for y in range(height):
+        for x in range(width):
+            if alpha[y, x]:
+                top = y
+                break
+        if top >= 0:
+            break
+    if top < 0:
+        return -1, -1, -1, -1
+    
+    bottom = top
+    for y in range(height - 1, top, -1):
+        for x in range(width):
+            if alpha[y, x]:
+                bottom = y
+                break
+        if bottom > top:
+            break
+    
+    left = width
+    right = -1
+    for y in range(top, bottom + 1):
+        for x in range(left):
+            if alpha[y, x]:
+                left = x
+                break
+        for x in range(width - 1, right, -1):
+            if alpha[y, x]:
+                right = x
+                break
+    return top, bottom, left, right
+
+# Compiled eagerly for the contiguous uint8 planes getchannel('A') produces;
+# without numba, find_content_bounds uses numpy reductions instead
+_bounds_kernel = (njit("UniTuple(int64, 4)(uint8[:, ::1])", cache=True)(_scan_alpha_bounds)
+                  if njit is not None else None)
 
 class BoundingBox(NamedTuple):
     """Represents the bounding box of non-transparent content."""
@@ -37,20 +124,20 @@ class BoundingBox(NamedTuple):
     
     @property
     def width(self) -> int:
-        return int(self.right - self.left + 1)  # Inclusive bounds
+        return self.right - self.left + 1  # Inclusive bounds
     
     @property
     def height(self) -> int:
-        return int(self.bottom - self.top + 1)  # Inclusive bounds
+        return self.bottom - self.top + 1  # Inclusive bounds
     
     def to_dict(self) -> Dict:
         return {
-            "left": int(self.left),
-            "top": int(self.top),
-            "right": int(self.right),
-            "bottom": int(self.bottom),
-            "width": int(self.width),
-            "height": int(self.height)
+            "left": self.left,
+            "top": self.top,
+            "right": self.right,
+            "bottom": self.bottom,
+            "width": self.width,
+            "height": self.height
         }
 
 class PieceOptimizationResult(NamedTuple):
@@ -58,21 +145,35 @@ class PieceOptimizationResult(NamedTuple):
     piece_id: str
     original_size: Tuple[int, int]
     content_bounds: BoundingBox      # Where the content was found in original image
-    cropped_image: Image.Image       # Pure content, no padding
+    cropped_image: Optional[Image.Image]  # Pure content, no padding; None once encoded by a worker
     content_hash: str
     memory_saved_bytes: int
 
 class PuzzleOptimizer:
     """Main puzzle optimization engine."""
     
-    def __init__(self, base_path: str, verbose: bool = False):
+    def __init__(self, base_path: str, verbose: bool = False, png_effort: str = "default"):
         self.base_path = Path(base_path)
         self.verbose = verbose
+        self.png_effort = png_effort
+        # Grid size whose work the current thread is doing, if any; used to
+        # label log lines while several grid sizes run at once
+        self._log_context = threading.local()
         
-    def log(self, message: str) -> None:
-        """Print log message if verbose is enabled."""
+    def log(self, message: str, *args) -> None:
+        """
+        Print log message if verbose is enabled.
+        
+        Any args are applied with str.format only when the message is printed,
+        so hot paths can skip formatting entirely when not verbose. Each line
+        is written in one call, and prefixed with the grid size being worked
+        on, so grid sizes logging from different threads don't splice their
+        output together and stay attributable.
+        """
         if self.verbose:
-            print(f"[PuzzleOptimizer] {message}")
+            grid_size = getattr(self._log_context, 'grid_size', None)
+            label = f"[{grid_size}] " if grid_size else ""
+            print(f"[PuzzleOptimizer] {label}{message.format(*args) if args else message}\n", end='')
     
     def find_content_bounds(self, image: Image.Image) -> Optional[BoundingBox]:
         """
@@ -87,27 +188,31 @@ class PuzzleOptimizer:
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
         
-        # Convert to numpy array for fast processing
-        img_array = np.array(image)
-        alpha_channel = img_array[:, :, 3]  # Alpha channel
+        # Only the alpha band matters for bounds; extract it alone so numpy
+        # holds 1 byte per pixel instead of the full 4-byte RGBA raster
+        alpha_channel = np.array(image.getchannel('A'))
         
-        # Find all non-transparent pixels
-        non_transparent = alpha_channel > 0
+        if _bounds_kernel is not None:
+            top, bottom, left, right = _bounds_kernel(alpha_channel)
+            if top < 0:
+                self.log(f"Warning: Image appears completely transparent")
+                return None
+            return BoundingBox(left, top, right, bottom)
         
-        if not np.any(non_transparent):
+        # Project non-transparent pixels onto each axis straight from the
+        # uint8 alpha plane (nonzero == visible), without a boolean mask copy
+        rows = np.flatnonzero(alpha_channel.any(axis=1))
+        if rows.size == 0:
             self.log(f"Warning: Image appears completely transparent")
             return None
+        top, bottom = int(rows[0]), int(rows[-1])
         
-        # Find bounds of non-transparent pixels
-        rows = np.any(non_transparent, axis=1)
-        cols = np.any(non_transparent, axis=0)
+        # Rows outside [top, bottom] are known to be empty, so the column
+        # projection only needs to read the content band
+        cols = np.flatnonzero(alpha_channel[top:bottom + 1].any(axis=0))
+        left, right = int(cols[0]), int(cols[-1])
         
-        top = int(np.argmax(rows))
-        bottom = int(len(rows) - 1 - np.argmax(rows[::-1]))
-        left = int(np.argmax(cols))
-        right = int(len(cols) - 1 - np.argmax(cols[::-1]))
-        
-        return BoundingBox(int(left), int(top), int(right), int(bottom))
+        return BoundingBox(left, top, right, bottom)
     
     def crop_to_exact_content(self, image: Image.Image, bounds: BoundingBox) -> Image.Image:
         """
@@ -118,18 +223,21 @@ class PuzzleOptimizer:
             bounds: Content bounding box (inclusive coordinates)
             
         Returns:
-            Cropped image containing only the actual content
+            Cropped image containing only the actual content (the source image
+            itself if it has no padding to remove)
         """
         # Convert inclusive bounds to exclusive for PIL crop
         # PIL crop expects (left, top, right, bottom) where right/bottom are exclusive
         crop_box = (bounds.left, bounds.top, bounds.right + 1, bounds.bottom + 1)
         
-        cropped = image.crop(crop_box)
+        # A box covering the whole image would only copy it
+        cropped = image if crop_box == (0, 0, image.width, image.height) else image.crop(crop_box)
         
-        self.log(f"  Content bounds (inclusive): left={bounds.left}, top={bounds.top}, right={bounds.right}, bottom={bounds.bottom}")
-        self.log(f"  PIL crop box (exclusive): {crop_box}")
-        self.log(f"  Expected size: {bounds.width}x{bounds.height}")
-        self.log(f"  Actual cropped size: {cropped.size[0]}x{cropped.size[1]}")
+        self.log("  Content bounds (inclusive): left={}, top={}, right={}, bottom={}",
+                 bounds.left, bounds.top, bounds.right, bounds.bottom)
+        self.log("  PIL crop box (exclusive): {}", crop_box)
+        self.log("  Expected size: {}x{}", bounds.width, bounds.height)
+        self.log("  Actual cropped size: {}x{}", cropped.size[0], cropped.size[1])
         
         # Verify the crop worked correctly
         expected_width = bounds.right - bounds.left + 1
@@ -140,10 +248,22 @@ class PuzzleOptimizer:
         
         return cropped
     
-    def calculate_content_hash(self, image: Image.Image) -> str:
-        """Calculate SHA-256 hash of image content for verification."""
-        img_bytes = image.tobytes()
-        return hashlib.sha256(img_bytes).hexdigest()[:8]
+    def calculate_content_hash(self, image: Image.Image, band_rows: int = 64) -> str:
+        """
+        Calculate SHA-256 hash of image content for verification.
+        
+        Pixels are fed to the hasher in bands of rows so only a small slice of
+        the raw buffer is materialized at a time; the hash is identical to
+        hashing ``image.tobytes()`` in one go.
+        """
+        # Integrity tag, not a security digest. hashlib's OpenSSL SHA-256
+        # already dispatches to SHA-NI / ARMv8 SHA instructions where present
+        hasher = hashlib.sha256(usedforsecurity=False)
+        width, height = image.size
+        for top in range(0, height, band_rows):
+            band = image.crop((0, top, width, min(top + band_rows, height)))
+            hasher.update(band.tobytes())
+        return hasher.hexdigest()[:8]
     
     def optimize_piece(self, piece_path: Path) -> Optional[PieceOptimizationResult]:
         """
@@ -157,17 +277,30 @@ class PuzzleOptimizer:
         """
         try:
             piece_id = piece_path.stem
-            self.log(f"Optimizing piece {piece_id}")
+            self.log("Optimizing piece {}", piece_id)
             
-            # Load original image
-            original_image = Image.open(piece_path).convert('RGBA')
+            # Load original image. 8-bit RGBA pieces decode with libspng when
+            # available; the pixels are identical to Pillow's, so content_hash
+            # doesn't depend on the decoder. fromarray() wraps the buffer
+            # without copying. convert() copies even when the mode already
+            # matches, so only convert pieces that aren't RGBA
+            if pyspng is not None:
+                png_data = piece_path.read_bytes()
+                if _is_rgba8_png(png_data):
+                    original_image = Image.fromarray(pyspng.load(png_data), 'RGBA')
+                else:
+                    original_image = Image.open(io.BytesIO(png_data))
+            else:
+                original_image = Image.open(piece_path)
+            if original_image.mode != 'RGBA':
+                original_image = original_image.convert('RGBA')
             original_size = original_image.size
             original_bytes = original_size[0] * original_size[1] * 4  # RGBA = 4 bytes per pixel
             
             # Find exact content bounds
             content_bounds = self.find_content_bounds(original_image)
             if content_bounds is None:
-                self.log(f"Warning: Piece {piece_id} has no content, skipping")
+                self.log("Warning: Piece {} has no content, skipping", piece_id)
                 return None
             
             # Crop to exact content with NO padding
@@ -177,12 +310,11 @@ class PuzzleOptimizer:
             # Calculate hash for verification
             content_hash = self.calculate_content_hash(cropped_image)
             
-            memory_saved = int(original_bytes - cropped_bytes)
-            reduction_percent = float((memory_saved / original_bytes) * 100)
+            memory_saved = original_bytes - cropped_bytes
             
-            self.log(f"  Original: {original_size[0]}x{original_size[1]} ({original_bytes:,} bytes)")
-            self.log(f"  Cropped:  {cropped_image.size[0]}x{cropped_image.size[1]} ({cropped_bytes:,} bytes)")
-            self.log(f"  Saved:    {memory_saved:,} bytes ({reduction_percent:.1f}%)")
+            self.log("  Original: {}x{} ({:,} bytes)", original_size[0], original_size[1], original_bytes)
+            self.log("  Cropped:  {}x{} ({:,} bytes)", cropped_image.size[0], cropped_image.size[1], cropped_bytes)
+            self.log("  Saved:    {:,} bytes ({:.1f}%)", memory_saved, (memory_saved / original_bytes) * 100)
             
             return PieceOptimizationResult(
                 piece_id=piece_id,
@@ -197,17 +329,26 @@ class PuzzleOptimizer:
             self.log(f"Error optimizing piece {piece_path}: {e}")
             return None
     
-    def optimize_grid_size(self, puzzle_id: str, grid_size: str) -> bool:
+    def optimize_grid_size(self, puzzle_id: str, grid_size: str,
+                           executor: Optional[ProcessPoolExecutor] = None) -> bool:
         """
         Optimize all pieces for a specific puzzle and grid size.
         
         Args:
             puzzle_id: Puzzle identifier
             grid_size: Grid size (e.g., "8x8", "12x12")
+            executor: Process pool to run pieces on; a private one is created
+                if omitted
             
         Returns:
             True if optimization succeeded
         """
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return self.optimize_grid_size(puzzle_id, grid_size, executor)
+        
+        self.log(f"--- Optimizing {puzzle_id} {grid_size} ---")
+        
         source_layout_path = self.base_path / "assets" / "puzzles" / puzzle_id / "layouts" / grid_size
         pieces_path = source_layout_path / "pieces"
         
@@ -229,37 +370,77 @@ class PuzzleOptimizer:
             shutil.copy2(original_layout, optimized_layout_path / "layout.ipuz.json")
             self.log(f"Copied layout.ipuz.json")
         
-        # Process all piece files
-        piece_files = list(pieces_path.glob("*.png"))
-        results = []
-        total_original_bytes = 0
-        total_saved_bytes = 0
-        
-        self.log(f"Processing {len(piece_files)} pieces...")
-        
-        for piece_file in sorted(piece_files):
-            result = self.optimize_piece(piece_file)
-            if result:
-                # Save optimized piece (pure content, no padding)
-                output_path = optimized_pieces_path / f"{result.piece_id}.png"
-                result.cropped_image.save(output_path, "PNG", optimize=True)
-                
-                results.append(result)
-                total_original_bytes += int(result.original_size[0] * result.original_size[1] * 4)
-                total_saved_bytes += int(result.memory_saved_bytes)
+        # Process all piece files in natural (row, column) order
+        with os.scandir(pieces_path) as entries:
+            piece_entries = [e for e in entries if e.name.endswith('.png') and e.is_file()]
+        piece_entries.sort(key=lambda e: _natural_sort_key(e.name[:-4]))
+        piece_files = [Path(e.path) for e in piece_entries]
+        results_by_id: Dict[str, PieceOptimizationResult] = {}
+        
+        # Reuse results for pieces whose source is unchanged since the last run
+        # and whose optimized output is still on disk. The cache is kept out of
+        # the bundled asset directory; drop any left there by older runs
+        (optimized_layout_path / ".cache.json").unlink(missing_ok=True)
+        cache_path = piece_cache_path(self.base_path, puzzle_id, grid_size)
+        cached_pieces = self._load_piece_cache(cache_path)
+        piece_cache: Dict[str, Dict] = {}
+        stamps: Dict[str, List[int]] = {}
+        stale_files = []
+        for piece_file, dir_entry in zip(piece_files, piece_entries):
+            stat = dir_entry.stat()
+            stamps[piece_file.stem] = [stat.st_mtime_ns, stat.st_size]
+            entry = cached_pieces.get(piece_file.stem)
+            if (entry is not None and entry["stamp"] == stamps[piece_file.stem]
+                    and (optimized_pieces_path / f"{piece_file.stem}.png").exists()):
+                results_by_id[piece_file.stem] = _result_from_cache_entry(piece_file.stem, entry)
+                piece_cache[piece_file.stem] = entry
+            else:
+                stale_files.append(piece_file)
+        
+        self.log(f"Processing {len(stale_files)} pieces ({len(results_by_id)} unchanged)...")
+        
+        # Pieces are independent and CPU-bound (decode, scan, hash, PNG encode),
+        # so fan them out to worker processes. Workers return encoded PNG bytes
+        # rather than PIL images to keep inter-process traffic small.
+        tasks = [(str(self.base_path), self.verbose, self.png_effort, str(piece_file))
+                 for piece_file in stale_files]
+        for outcome in executor.map(_optimize_piece_worker, tasks):
+            if outcome is None:
+                continue
+            result, png_data = outcome
+            
+            # Save optimized piece (pure content, no padding)
+            output_path = optimized_pieces_path / f"{result.piece_id}.png"
+            output_path.write_bytes(png_data)
+            
+            results_by_id[result.piece_id] = result
+            piece_cache[result.piece_id] = _cache_entry_for_result(result, stamps[result.piece_id])
         
+        # Keep metadata in source file order regardless of which pieces were cached
+        results = [results_by_id[f.stem] for f in piece_files if f.stem in results_by_id]
         if not results:
             self.log(f"Error: No pieces were successfully optimized")
             return False
         
+        total_original_bytes = sum(r.original_size[0] * r.original_size[1] * 4 for r in results)
+        total_saved_bytes = sum(r.memory_saved_bytes for r in results)
+        
         # Generate optimization metadata
         canvas_info = self._load_canvas_info(source_layout_path / "layout.ipuz.json")
         metadata = self._generate_optimization_metadata(results, canvas_info, total_original_bytes, total_saved_bytes)
         
-        # Save metadata with custom encoder to handle numpy types
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({"tool": Path(__file__).stem, "png_effort": self.png_effort, "pieces": piece_cache}, f)
+        
+        # Bounds and totals are built from plain Python ints, so no custom
+        # encoder is needed; orjson also handles any numpy values natively
         metadata_path = optimized_layout_path / "optimization_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=convert_to_serializable)
+        if orjson:
+            metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2)
         
         total_reduction = (total_saved_bytes / total_original_bytes) * 100
         self.log(f"✅ Optimization complete!")
@@ -269,11 +450,36 @@ class PuzzleOptimizer:
         
         return True
     
+    def _load_piece_cache(self, cache_path: Path) -> Dict[str, Dict]:
+        """
+        Load per-piece results recorded by a previous run.
+        
+        Entries are only valid for the same tool and encoder settings, so a
+        cache written by another optimizer sharing this output directory, or
+        with a different --png-effort, is ignored.
+        
+        Args:
+            cache_path: Path to the grid's piece cache (see piece_cache_path)
+            
+        Returns:
+            Mapping of piece id to cache entry (empty if missing or unusable)
+        """
+        if not cache_path.exists():
+            return {}
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+            if cache.get('tool') != Path(__file__).stem or cache.get('png_effort') != self.png_effort:
+                return {}
+            return cache.get('pieces', {})
+        except Exception as e:
+            self.log(f"Warning: Ignoring unreadable piece cache {cache_path}: {e}")
+            return {}
+    
     def _load_canvas_info(self, layout_path: Path) -> Dict:
         """Load canvas information from layout.ipuz.json."""
         try:
-            with open(layout_path, 'r') as f:
-                layout_data = json.load(f)
+            layout_data = _read_layout_json(str(layout_path), layout_path.stat().st_mtime_ns)
             return layout_data.get('canvas', {'width': 2048, 'height': 2048})
         except Exception as e:
             self.log(f"Warning: Could not load canvas info from {layout_path}: {e}")
@@ -285,57 +491,52 @@ class PuzzleOptimizer:
         """Generate the optimization metadata JSON for NO-PADDING approach."""
         pieces_metadata = {}
         
+        # Every piece shares the puzzle canvas, so build its size once. Pieces
+        # keep their own canvas_size entry because the Flutter asset manager
+        # reads it per piece; the JSON encoder emits the shared dict for each.
+        canvas_size = {
+            "width": int(canvas_info['width']),
+            "height": int(canvas_info['height'])
+        }
+        
         for result in results:
             content_bounds = result.content_bounds
-            cropped_image = result.cropped_image
-            
-            # Verify dimensions match
-            actual_width = cropped_image.size[0]
-            actual_height = cropped_image.size[1]
-            expected_width = content_bounds.width
-            expected_height = content_bounds.height
             
-            if actual_width != expected_width or actual_height != expected_height:
-                raise ValueError(f"Piece {result.piece_id}: dimension mismatch! "
-                               f"Expected {expected_width}x{expected_height}, "
-                               f"got {actual_width}x{actual_height}")
+            # crop_to_exact_content already verified the cropped image matches
+            # these bounds before the image was encoded
+            actual_width = content_bounds.width
+            actual_height = content_bounds.height
             
             # Store the original canvas coordinates where this content was found
             bounds_dict = {
-                "left": int(content_bounds.left),
-                "top": int(content_bounds.top),
-                "right": int(content_bounds.right),
-                "bottom": int(content_bounds.bottom),
-                "width": int(content_bounds.width),    # Matches actual cropped image width
-                "height": int(content_bounds.height)   # Matches actual cropped image height
+                "left": content_bounds.left,
+                "top": content_bounds.top,
+                "right": content_bounds.right,
+                "bottom": content_bounds.bottom,
+                "width": content_bounds.width,    # Matches actual cropped image width
+                "height": content_bounds.height   # Matches actual cropped image height
             }
             
             pieces_metadata[result.piece_id] = {
                 "bounds": bounds_dict,
-                "canvas_size": {
-                    "width": int(canvas_info['width']),
-                    "height": int(canvas_info['height'])
-                },
+                "canvas_size": canvas_size,
                 "content_hash": result.content_hash,
                 "cropped_filename": f"{result.piece_id}.png"
             }
             
-            self.log(f"Piece {result.piece_id}: canvas_position=({content_bounds.left},{content_bounds.top}), "
-                    f"size={actual_width}x{actual_height}")
+            self.log("Piece {}: canvas_position=({},{}), size={}x{}", result.piece_id,
+                     content_bounds.left, content_bounds.top, actual_width, actual_height)
         
         return {
             "version": "1.0", 
-            "canvas_size": {
-                "width": int(canvas_info['width']),
-                "height": int(canvas_info['height'])
-            },
+            "canvas_size": canvas_size,
             "pieces": pieces_metadata,
             "statistics": {
-                "memory_reduction_percent": float((total_saved_bytes / total_original_bytes) * 100) if total_original_bytes > 0 else 0.0,
-                "total_pieces": int(len(results)),
-                "original_total_bytes": int(total_original_bytes),
-                "optimized_total_bytes": int(total_original_bytes - total_saved_bytes),
-                "bytes_saved": int(total_saved_bytes)
+                "memory_reduction_percent": (total_saved_bytes / total_original_bytes) * 100 if total_original_bytes > 0 else 0.0,
+                "total_pieces": len(results),
+                "original_total_bytes": total_original_bytes,
+                "optimized_total_bytes": total_original_bytes - total_saved_bytes,
+                "bytes_saved": total_saved_bytes
             }
         }
     
@@ -360,20 +561,40 @@ class PuzzleOptimizer:
         if grid_sizes is None:
             grid_sizes = [d.name for d in puzzle_path.iterdir() 
                          if d.is_dir() and not d.name.endswith('_optimized')]
+        # Grid sizes run concurrently, so a repeated one would have two runs
+        # writing the same output directory at once
+        grid_sizes = list(dict.fromkeys(grid_sizes))
         
         self.log(f"Optimizing puzzle '{puzzle_id}' grid sizes: {grid_sizes}")
         
+        # Grid sizes share one process pool and are driven from two threads, so
+        # one grid's metadata and file writes overlap the next grid's piece
+        # work without oversubscribing the CPU
         success_count = 0
-        for grid_size in grid_sizes:
-            self.log(f"\n--- Optimizing {puzzle_id} {grid_size} ---")
-            if self.optimize_grid_size(puzzle_id, grid_size):
-                success_count += 1
-            else:
-                self.log(f"❌ Failed to optimize {puzzle_id} {grid_size}")
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+                ThreadPoolExecutor(max_workers=2) as grid_executor:
+            futures = {}
+            for grid_size in grid_sizes:
+                futures[grid_executor.submit(self._optimize_grid_size_labelled,
+                                             puzzle_id, grid_size, executor)] = grid_size
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                else:
+                    self.log(f"❌ Failed to optimize {puzzle_id} {futures[future]}")
         
         self.log(f"\n✅ Optimization summary: {success_count}/{len(grid_sizes)} grid sizes optimized")
         return success_count == len(grid_sizes)
     
+    def _optimize_grid_size_labelled(self, puzzle_id: str, grid_size: str,
+                                     executor: ProcessPoolExecutor) -> bool:
+        """Run optimize_grid_size on a grid thread, labelling its log lines with the grid size."""
+        self._log_context.grid_size = grid_size
+        try:
+            return self.optimize_grid_size(puzzle_id, grid_size, executor)
+        finally:
+            self._log_context.grid_size = None
+    
     def analyze_memory_usage(self, puzzle_id: str) -> None:
         """Analyze and display memory usage before and after optimization."""
         puzzle_path = self.base_path / "assets" / "puzzles" / puzzle_id / "layouts"
@@ -424,6 +645,52 @@ class PuzzleOptimizer:
             else:
                 print(f"  Status: Not optimized")
 
+def _cache_entry_for_result(result: PieceOptimizationResult, stamp: List[int]) -> Dict:
+    """Build the piece cache entry for a piece from its source stamp and result."""
+    bounds = result.content_bounds
+    return {
+        "stamp": stamp,
+        "original_size": list(result.original_size),
+        "content_bounds": [bounds.left, bounds.top, bounds.right, bounds.bottom],
+        "content_hash": result.content_hash,
+        "memory_saved_bytes": result.memory_saved_bytes
+    }
+
+def _result_from_cache_entry(piece_id: str, entry: Dict) -> PieceOptimizationResult:
+    """Rebuild a piece's optimization result from its piece cache entry."""
+    return PieceOptimizationResult(
+        piece_id=piece_id,
+        original_size=tuple(entry["original_size"]),
+        content_bounds=BoundingBox(*entry["content_bounds"]),
+        cropped_image=None,
+        content_hash=entry["content_hash"],
+        memory_saved_bytes=entry["memory_saved_bytes"]
+    )
+
+def _optimize_piece_worker(task: Tuple[str, bool, str, str]) -> Optional[Tuple[PieceOptimizationResult, bytes]]:
+    """
+    Process-pool entry point: optimize a single piece and encode it as PNG.
+    
+    Args:
+        task: (base_path, verbose, png_effort, piece_path) tuple
+        
+    Returns:
+        The optimization result (without its image) and the encoded PNG bytes,
+        or None if the piece could not be optimized
+    """
+    base_path, verbose, png_effort, piece_path = task
+    optimizer = PuzzleOptimizer(base_path, verbose, png_effort)
+    # Pieces are laid out as <grid_size>/pieces/<id>.png
+    optimizer._log_context.grid_size = Path(piece_path).parent.parent.name
+    result = optimizer.optimize_piece(Path(piece_path))
+    if result is None:
+        return None
+    
+    buffer = io.BytesIO()
+    result.cropped_image.save(buffer, "PNG", compress_level=PNG_EFFORT_LEVELS[png_effort],
+                              optimize=png_effort == "max")
+    return result._replace(cropped_image=None), buffer.getvalue()
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(
@@ -442,6 +709,9 @@ Examples:
   
   # Verbose output
   python optimize_puzzle_assets_no_padding.py sample_puzzle_01 --verbose
+  
+  # Smallest files for release builds (slowest encode)
+  python optimize_puzzle_assets_no_padding.py sample_puzzle_01 --png-effort max
         """
     )
     
@@ -450,11 +720,13 @@ Examples:
     parser.add_argument('--analyze-only', action='store_true', help='Only analyze memory usage')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--base-path', default='.', help='Base path to puzzle game project')
+    parser.add_argument('--png-effort', choices=sorted(PNG_EFFORT_LEVELS), default='default',
+                        help='PNG encode effort: fast (zlib 1), default (zlib 6) or max (zlib 9 + optimize)')
     
     args = parser.parse_args()
     
     # Initialize optimizer
-    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose)
+    optimizer = PuzzleOptimizer(args.base_path, verbose=args.verbose, png_effort=args.png_effort)
     
     if args.analyze_only:
         optimizer.analyze_memory_usage(args.puzzle_id)
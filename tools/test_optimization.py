@@ -6,9 +6,10 @@ This script tests the optimization tool and verifies that optimized assets
 maintain perfect placement accuracy.
 """
 
-import os
 import sys
 import json
+import importlib.util
+import subprocess
 import tempfile
 import shutil
 from pathlib import Path
@@ -17,7 +18,8 @@ import numpy as np
 
 # Add the tools directory to path so we can import the optimizer
 sys.path.insert(0, str(Path(__file__).parent))
-from optimize_puzzle_assets import PuzzleOptimizer, BoundingBox
+from optimize_puzzle_assets import PuzzleOptimizer, BoundingBox, piece_cache_path
+import optimize_puzzle_assets_fixed
 
 def create_test_puzzle(temp_dir: Path, puzzle_id: str = "test_puzzle") -> Path:
     """Create a test puzzle with known properties."""
@@ -39,30 +41,30 @@ def create_test_puzzle(temp_dir: Path, puzzle_id: str = "test_puzzle") -> Path:
         json.dump(layout_data, f, indent=2)
     
     # Create test pieces with known content areas
-    # Each piece is 400x400 with content in specific areas
+    # Each piece is 400x400 with content in specific areas. One RGBA buffer
+    # is cleared and reused for every piece; fromarray() wraps it without copying
+    pixels = np.zeros((400, 400, 4), dtype=np.uint8)
     for row in range(2):
         for col in range(2):
             piece_id = f"{row}_{col}"
             
-            # Create 400x400 transparent image
-            img = Image.new('RGBA', (400, 400), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
+            # Start from a fully transparent image
+            pixels.fill(0)
             
             # Draw content in specific area for each piece
             content_x = col * 150 + 50  # Offset content based on position
             content_y = row * 150 + 50
             content_size = 100
             
-            # Draw a colored rectangle as content
+            # Fill a colored rectangle as content (edges inclusive, like
+            # ImageDraw.rectangle)
             color = (255, row * 100, col * 100, 255)  # Different color per piece
-            draw.rectangle([
-                content_x, content_y,
-                content_x + content_size, content_y + content_size
-            ], fill=color)
+            pixels[content_y:content_y + content_size + 1,
+                   content_x:content_x + content_size + 1] = color
             
-            # Save piece
+            # Save piece; fixtures only need to be lossless, not small
             piece_path = pieces_path / f"{piece_id}.png"
-            img.save(piece_path, "PNG")
+            Image.fromarray(pixels, 'RGBA').save(piece_path, "PNG", compress_level=1)
     
     return puzzle_path
 
@@ -90,6 +92,32 @@ def test_content_bounds_detection():
     
     print("✅ Content bounds detection test passed")
 
+def test_fixed_alpha_channel_bounds():
+    """Test the fixed optimizer's bounds scan on read-only getchannel('A') arrays."""
+    print("Testing fixed optimizer alpha channel bounds...")
+    
+    img = Image.new('RGBA', (200, 200), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((50, 30, 150, 120), fill=(255, 0, 0, 255))
+    
+    # optimize_piece passes np.asarray(), which is a read-only view; this is the
+    # path the numba kernel takes when numba is installed
+    optimizer = optimize_puzzle_assets_fixed.PuzzleOptimizer(".", verbose=True)
+    alpha_channel = np.asarray(img.getchannel('A'))
+    assert not alpha_channel.flags.writeable, "getchannel('A') array should be read-only"
+    
+    expected = optimize_puzzle_assets_fixed.BoundingBox(50, 30, 150, 120)
+    assert optimizer.find_content_bounds(alpha_channel) == expected, "Read-only alpha bounds mismatch"
+    assert optimizer.find_content_bounds(alpha_channel.copy()) == expected, "Writable alpha bounds mismatch"
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        create_test_puzzle(temp_path, "test_puzzle")
+        optimizer = optimize_puzzle_assets_fixed.PuzzleOptimizer(str(temp_path), verbose=False)
+        assert optimizer.optimize_puzzle("test_puzzle", ["2x2"]), "Fixed optimizer should succeed"
+    
+    print("✅ Fixed optimizer alpha channel bounds test passed")
+
 def test_cropping_accuracy():
     """Test that cropping maintains content integrity."""
     print("Testing cropping accuracy...")
@@ -108,19 +136,22 @@ def test_cropping_accuracy():
     optimizer = PuzzleOptimizer(".", verbose=True)
     cropped = optimizer.crop_image_to_bounds(img, content_bounds, padding=2)
     
-    # Verify cropped image contains all content
-    expected_width = content_bounds.width + 4  # +4 for padding
-    expected_height = content_bounds.height + 4
+    # Verify cropped image contains all content; the drawn rectangle includes
+    # its right/bottom edges, so content spans right - left + 1 pixels
+    content_width = content_bounds.right - content_bounds.left + 1
+    content_height = content_bounds.bottom - content_bounds.top + 1
+    expected_width = content_width + 4  # +4 for padding
+    expected_height = content_height + 4
     
     assert cropped.size[0] == expected_width, f"Width should be {expected_width}, got {cropped.size[0]}"
     assert cropped.size[1] == expected_height, f"Height should be {expected_height}, got {cropped.size[1]}"
     
     # Verify content is preserved
     cropped_array = np.array(cropped)
-    # Content should be at position (2, 2) due to padding
-    content_pixel = cropped_array[2, 2]
-    assert content_pixel[0] == 255, "Red content should be preserved"
-    assert content_pixel[3] == 255, "Alpha should be preserved"
+    # Content should start at position (2, 2) due to padding
+    content_region = cropped_array[2:2 + content_height, 2:2 + content_width]
+    expected = np.full((content_height, content_width, 4), (255, 0, 0, 255), dtype=np.uint8)
+    assert np.array_equal(content_region, expected), "Red content and alpha should be preserved"
     
     print("✅ Cropping accuracy test passed")
 
@@ -155,10 +186,12 @@ def test_full_optimization():
                 piece_path = pieces_path / f"{row}_{col}.png"
                 assert piece_path.exists(), f"Optimized piece {row}_{col}.png should exist"
                 
-                # Verify piece is smaller than original
-                optimized_img = Image.open(piece_path)
-                assert optimized_img.size[0] < 400, "Optimized width should be smaller"
-                assert optimized_img.size[1] < 400, "Optimized height should be smaller"
+                # Verify piece is smaller than original; size comes from the
+                # PNG header, so close the file without decoding pixels
+                with Image.open(piece_path) as optimized_img:
+                    width, height = optimized_img.size
+                assert width < 400, "Optimized width should be smaller"
+                assert height < 400, "Optimized height should be smaller"
         
         # Verify metadata exists and is valid
         metadata_path = optimized_path / "optimization_metadata.json"
@@ -197,6 +230,57 @@ def test_memory_calculations():
         
         print("✅ Memory calculations test passed")
 
+def test_incremental_rerun():
+    """Test cache reuse and hardlinked duplicates across runs of one optimizer."""
+    print("Testing incremental re-run...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        puzzle_path = create_test_puzzle(temp_path, "test_puzzle")
+        source_pieces = puzzle_path / "layouts" / "2x2" / "pieces"
+        optimized_path = puzzle_path / "layouts" / "2x2_optimized"
+        optimized_pieces = optimized_path / "pieces"
+        
+        # A duplicate piece is linked to the first output with the same content
+        shutil.copy2(source_pieces / "0_0.png", source_pieces / "1_1.png")
+        optimizer = PuzzleOptimizer(str(temp_path), verbose=False)
+        assert optimizer.optimize_puzzle("test_puzzle", ["2x2"]), "First run should succeed"
+        assert piece_cache_path(temp_path, "test_puzzle", "2x2").exists(), "Piece cache should be written"
+        assert not (optimized_path / ".cache.json").exists(), "Piece cache must stay out of the asset directory"
+        assert (optimized_pieces / "0_0.png").samefile(optimized_pieces / "1_1.png"), \
+            "Identical crops should share one file"
+        
+        with open(optimized_path / "optimization_metadata.json", 'r') as f:
+            first_metadata = json.load(f)
+        
+        # Unchanged sources are served from the cache without rewriting outputs
+        output_stamps = {path.name: path.stat().st_mtime_ns for path in optimized_pieces.iterdir()}
+        assert optimizer.optimize_puzzle("test_puzzle", ["2x2"]), "Cached run should succeed"
+        assert output_stamps == {path.name: path.stat().st_mtime_ns for path in optimized_pieces.iterdir()}, \
+            "Cached pieces should not be rewritten"
+        
+        # Replace 0_0 and give 1_0 the old 0_0 content: 1_0 must get its own
+        # crop, not a link to the rewritten 0_0 output
+        shutil.copy2(source_pieces / "0_0.png", source_pieces / "1_0.png")
+        pixels = np.zeros((400, 400, 4), dtype=np.uint8)
+        pixels[10:60, 10:60] = (1, 2, 3, 255)
+        Image.fromarray(pixels, 'RGBA').save(source_pieces / "0_0.png", "PNG", compress_level=1)
+        assert optimizer.optimize_puzzle("test_puzzle", ["2x2"]), "Changed run should succeed"
+        
+        with open(optimized_path / "optimization_metadata.json", 'r') as f:
+            metadata = json.load(f)
+        assert metadata["pieces"]["1_0"]["content_hash"] == first_metadata["pieces"]["0_0"]["content_hash"], \
+            "1_0 should carry the old 0_0 content"
+        assert not (optimized_pieces / "1_0.png").samefile(optimized_pieces / "0_0.png"), \
+            "1_0 must not share the rewritten 0_0 output"
+        
+        with Image.open(optimized_pieces / "1_0.png") as moved, Image.open(optimized_pieces / "1_1.png") as kept:
+            assert np.array_equal(np.asarray(moved), np.asarray(kept)), "1_0 should hold the old 0_0 pixels"
+        with Image.open(optimized_pieces / "0_0.png") as replaced:
+            assert np.asarray(replaced)[2, 2].tolist() == [1, 2, 3, 255], "0_0 should hold the new pixels"
+    
+    print("✅ Incremental re-run test passed")
+
 def test_edge_cases():
     """Test edge cases and error handling."""
     print("Testing edge cases...")
@@ -222,9 +306,11 @@ def run_all_tests():
     
     try:
         test_content_bounds_detection()
+        test_fixed_alpha_channel_bounds()
         test_cropping_accuracy()
         test_full_optimization()
         test_memory_calculations()
+        test_incremental_rerun()
         test_edge_cases()
         
         print("\n🎉 All tests passed! The optimization tool is working correctly.")
@@ -239,8 +325,14 @@ def run_all_tests():
 def main():
     """Main test runner."""
     if len(sys.argv) > 1 and sys.argv[1] == "--requirements":
-        print("Installing required packages...")
-        os.system("pip install pillow numpy")
+        # Only run pip (with this interpreter, no shell) for what's missing
+        missing = [package for module, package in (('PIL', 'pillow'), ('numpy', 'numpy'))
+                   if importlib.util.find_spec(module) is None]
+        if missing:
+            print("Installing required packages...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', *missing], check=True)
+        else:
+            print("Required packages are already installed")
         return
     
     success = run_all_tests()
@@ -5,10 +5,22 @@ Asset Loading Verification Tool
 This tool helps verify that optimized assets are properly included and accessible.
 """
 
+import os
+import re
 import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster metadata parsing
+except ImportError:
+    orjson = None
+
+def count_png_files(directory: Path) -> int:
+    """Count *.png entries in a directory without building a list of paths."""
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith('.png'))
+
 def check_asset_structure():
     """Check if optimized assets exist in the expected locations."""
     print("🔍 Checking Asset Structure")
@@ -29,7 +41,7 @@ def check_asset_structure():
         # Check original assets
         original_path = base_path / grid_size / "pieces"
         if original_path.exists():
-            original_count = len(list(original_path.glob("*.png")))
+            original_count = count_png_files(original_path)
             print(f"  ✅ Original: {original_count} pieces")
         else:
             print(f"  ❌ Original: Not found")
@@ -43,8 +55,8 @@ def check_asset_structure():
         if optimized_path.exists():
             if metadata_path.exists():
                 try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
+                    raw = metadata_path.read_bytes()
+                    metadata = orjson.loads(raw) if orjson else json.loads(raw)
                     
                     pieces_count = len(metadata.get('pieces', {}))
                     stats = metadata.get('statistics', {})
@@ -54,7 +66,7 @@ def check_asset_structure():
                     
                     # Check if pieces actually exist
                     if pieces_path.exists():
-                        actual_pieces = len(list(pieces_path.glob("*.png")))
+                        actual_pieces = count_png_files(pieces_path)
                         if actual_pieces == pieces_count:
                             print(f"  ✅ Files: All {actual_pieces} optimized pieces present")
                         else:
@@ -84,8 +96,18 @@ def check_pubspec_yaml():
         print("❌ pubspec.yaml not found")
         return False
     
+    # Collect asset list entries ("- path") once so each lookup is a set hit
+    # instead of a substring scan over the whole file. Entries are normalised
+    # the way YAML reads them: inline comments and quotes dropped, and the
+    # trailing slash made optional on both sides
+    asset_entries = set()
     with open(pubspec_path, 'r') as f:
-        content = f.read()
+        for line in f:
+            line = line.strip()
+            if not line.startswith('-'):
+                continue
+            entry = re.split(r'\s#', line[1:], maxsplit=1)[0].strip().strip('"\'')
+            asset_entries.add(entry.rstrip('/'))
     
     required_paths = [
         "assets/puzzles/sample_puzzle_01/layouts/8x8_optimized/",
@@ -95,7 +117,7 @@ def check_pubspec_yaml():
     
     all_present = True
     for path in required_paths:
-        if path in content:
+        if path.rstrip('/') in asset_entries:
             print(f"  ✅ {path}")
         else:
             print(f"  ❌ {path} - Missing from pubspec.yaml")
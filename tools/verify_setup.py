@@ -3,24 +3,23 @@
 Quick test to verify the optimization script works
 """
 
+import os
 import sys
-import subprocess
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 def test_script_syntax():
     """Test that the Python script has valid syntax."""
+    script_path = Path('tools/optimize_puzzle_assets.py')
     try:
-        result = subprocess.run([
-            sys.executable, '-m', 'py_compile', 'tools/optimize_puzzle_assets.py'
-        ], capture_output=True, text=True, cwd='.')
-        
-        if result.returncode == 0:
-            print("✅ Python script syntax is valid")
-            return True
-        else:
-            print("❌ Python script has syntax errors:")
-            print(result.stderr)
-            return False
+        # Compile in-process rather than spawning an interpreter for py_compile
+        compile(script_path.read_bytes(), str(script_path), 'exec')
+        print("✅ Python script syntax is valid")
+        return True
+    except SyntaxError as e:
+        print("❌ Python script has syntax errors:")
+        print(e)
+        return False
     except Exception as e:
         print(f"❌ Error testing script: {e}")
         return False
@@ -30,15 +29,20 @@ def check_dependencies():
     required_packages = ['PIL', 'numpy']
     missing_packages = []
     
+    # Versions come from installed package metadata, so the packages
+    # themselves (and PIL's native extension) are never imported
     for package in required_packages:
         try:
             if package == 'PIL':
-                import PIL
-                print(f"✅ PIL (Pillow) version: {PIL.__version__}")
+                # Pillow-SIMD installs under its own distribution name
+                try:
+                    print(f"✅ PIL (Pillow-SIMD) version: {version('Pillow-SIMD')}")
+                except PackageNotFoundError:
+                    print(f"✅ PIL (Pillow) version: {version('Pillow')}")
+                    print("   💡 Optional: Pillow-SIMD is a faster drop-in (see tools/README.md)")
             elif package == 'numpy':
-                import numpy
-                print(f"✅ NumPy version: {numpy.__version__}")
-        except ImportError:
+                print(f"✅ NumPy version: {version('numpy')}")
+        except PackageNotFoundError:
             missing_packages.append(package)
             print(f"❌ Missing package: {package}")
     
@@ -80,12 +84,13 @@ def check_puzzle_assets():
         print(f"❌ Pieces directory not found: {pieces_path}")
         return False
     
-    piece_files = list(pieces_path.glob("*.png"))
-    if not piece_files:
+    with os.scandir(pieces_path) as entries:
+        piece_count = sum(1 for entry in entries if entry.name.endswith('.png'))
+    if not piece_count:
         print(f"❌ No PNG pieces found in: {pieces_path}")
         return False
     
-    print(f"✅ Found {len(piece_files)} piece files in {first_grid}")
+    print(f"✅ Found {piece_count} piece files in {first_grid}")
     return True
 
 def main():